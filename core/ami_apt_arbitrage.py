@@ -32,6 +32,9 @@ class AmiAptArbitrageCalculator:
         """Initialize calculator with fee configuration."""
         self.cex_fee = cex_fee
         self.dex_fee = dex_fee
+        # Fees are fixed per calculator — work out each direction's total once
+        self._dex_to_cex_fees_pct = (dex_fee + cex_fee) * 100           # 1 DEX + 1 CEX trade
+        self._cex_to_dex_fees_pct = (cex_fee * 2 + dex_fee) * 100       # 2 CEX trades + 1 DEX trade
     
     def calculate_dex_to_cex_opportunity(
         self,
@@ -67,7 +70,7 @@ class AmiAptArbitrageCalculator:
         # Calculate net profit after fees
         # DEX fee: buying AMI
         # CEX fee: selling AMI
-        total_fees_pct = (self.dex_fee + self.cex_fee) * 100
+        total_fees_pct = self._dex_to_cex_fees_pct
         net_profit_pct = price_diff_pct - total_fees_pct
         
         is_profitable = net_profit_pct >= self.MIN_PROFIT_PCT
@@ -118,7 +121,7 @@ class AmiAptArbitrageCalculator:
         # Calculate net profit after fees
         # CEX fee: buying AMI and selling APT
         # DEX fee: selling AMI for APT
-        total_fees_pct = (self.cex_fee * 2 + self.dex_fee) * 100  # 2 CEX trades + 1 DEX trade
+        total_fees_pct = self._cex_to_dex_fees_pct
         net_profit_pct = price_diff_pct - total_fees_pct
         
         is_profitable = net_profit_pct >= self.MIN_PROFIT_PCT
@@ -246,7 +246,8 @@ class ArbitrageEngine:
         """Return (buy_volume, sell_volume, net_profit)."""
         buy_vol = qty * buy_price
         sell_vol = qty * sell_price
-        profit = sell_vol - buy_vol - (buy_vol * buy_fee_rate) - (sell_vol * sell_fee_rate)
+        # Fees folded into the volumes: two multiplies instead of four
+        profit = sell_vol * (1.0 - sell_fee_rate) - buy_vol * (1.0 + buy_fee_rate)
         return buy_vol, sell_vol, profit
 
     @staticmethod
@@ -494,13 +495,8 @@ class ArbitrageEngine:
     async def _trigger_dex_involved_checks(self) -> None:
         """Trigger arbitrage checks that involve DEX prices immediately after a DEX update."""
         try:
-            cex_prices = self.collector.get(self.cex_symbol)
-            bybit = cex_prices.get("bybit")
-            mexc = cex_prices.get("mexc")
-
-            apt_prices = self.collector.get(self.apt_cex_symbol)
-            bybit_apt = apt_prices.get("bybit")
-            mexc_apt = apt_prices.get("mexc")
+            bybit, mexc = self.collector.snapshot_cex(self.cex_symbol)
+            bybit_apt, mexc_apt = self.collector.snapshot_cex(self.apt_cex_symbol)
 
             opportunities = self._check_all_routes(bybit, mexc, bybit_apt, mexc_apt)
             
@@ -1218,13 +1214,8 @@ class ArbitrageEngine:
             self.gas_cost_usd = current_gas_cost
 
             # 1. Collect potential opportunities
-            cex_prices = self.collector.get(self.cex_symbol)
-            bybit = cex_prices.get("bybit")
-            mexc = cex_prices.get("mexc")
-
-            apt_prices = self.collector.get(self.apt_cex_symbol)
-            bybit_apt = apt_prices.get("bybit")
-            mexc_apt = apt_prices.get("mexc")
+            bybit, mexc = self.collector.snapshot_cex(self.cex_symbol)
+            bybit_apt, mexc_apt = self.collector.snapshot_cex(self.apt_cex_symbol)
 
             now = time.time()
             if now - self._last_price_log >= self._PRICE_LOG_INTERVAL_S:
@@ -380,3 +380,13 @@ class BalanceManager:
             except Exception as e:
                 logger.error(f"BalanceManager refresh loop error: {e}")
             await asyncio.sleep(interval)
+
+    async def close(self) -> None:
+        """Close the Aptos REST client and HTTP session."""
+        try:
+            if self._http_session and not self._http_session.closed:
+                await self._http_session.close()
+                self._http_session = None
+            await self.aptos_client.close()
+        except Exception:
+            pass
@@ -22,6 +22,7 @@ Entry functions:
 from __future__ import annotations
 
 import asyncio
+import random
 import time
 from dataclasses import dataclass
 from typing import Optional
@@ -64,6 +65,10 @@ AMI_DECIMALS = 8
 APT_METADATA_ADDRESS = "0xa"
 USDT_METADATA_ADDRESS = "0x357b0b74bc833e95a115ad22604854d6b0fca151cecd94111770e5d6ffc9dc2b"
 
+# Shared across instances: once the node rate-limits one submission, every
+# other swap holds off until this time.time() deadline instead of piling on.
+_rate_limited_until: float = 0.0
+
 
 # ────────────────────────────────────────────────────────────────────────────
 #  Result dataclass
@@ -169,19 +174,28 @@ class CellanaDexSwap:
 
         amount_in_raw = _to_octas(amount_apt, APT_DECIMALS)
 
-        # If no explicit min_out, simulate to get expected output
+        # If no explicit min_out, simulate to get expected output. The
+        # tx's sequence-number lookup doesn't depend on the quote, so it
+        # runs alongside it.
+        sequence_number = None
         if min_ami_out is None:
-            try:
-                expected = await self.get_amount_out_apt_to_ami(amount_apt)
+            expected, seq = await asyncio.gather(
+                self.get_amount_out_apt_to_ami(amount_apt),
+                self.client.account_sequence_number(self.account.address()),
+                return_exceptions=True,
+            )
+            if isinstance(seq, int):
+                sequence_number = seq
+            if isinstance(expected, Exception):
+                logger.warning(f"get_amount_out failed, using 0 min_out: {expected}")
+                min_ami_out = 0.0
+            else:
                 min_ami_out = expected * (1.0 - slippage / 100.0)
                 logger.info(
                     f"APT→AMI quote: {amount_apt:.6f} APT → "
                     f"~{expected:.4f} AMI (min={min_ami_out:.4f}, "
                     f"slip={slippage}%)"
                 )
-            except Exception as e:
-                logger.warning(f"get_amount_out failed, using 0 min_out: {e}")
-                min_ami_out = 0.0
 
         min_out_raw = _to_octas(min_ami_out, AMI_DECIMALS)
         recipient = self.account.address()
@@ -205,7 +219,7 @@ class CellanaDexSwap:
         )
 
         return await self._submit_and_wait(
-            payload, amount_apt, "APT→AMI", t0
+            payload, amount_apt, "APT→AMI", t0, sequence_number
         )
 
     # ------------------------------------------------------------------ #
@@ -229,18 +243,26 @@ class CellanaDexSwap:
 
         amount_in_raw = _to_octas(amount_ami, AMI_DECIMALS)
 
+        # Quote and sequence-number lookup are independent — run together
+        sequence_number = None
         if min_apt_out is None:
-            try:
-                expected = await self.get_amount_out_ami_to_apt(amount_ami)
+            expected, seq = await asyncio.gather(
+                self.get_amount_out_ami_to_apt(amount_ami),
+                self.client.account_sequence_number(self.account.address()),
+                return_exceptions=True,
+            )
+            if isinstance(seq, int):
+                sequence_number = seq
+            if isinstance(expected, Exception):
+                logger.warning(f"get_amount_out failed, using 0 min_out: {expected}")
+                min_apt_out = 0.0
+            else:
                 min_apt_out = expected * (1.0 - slippage / 100.0)
                 logger.info(
                     f"AMI→APT quote: {amount_ami:.4f} AMI → "
                     f"~{expected:.6f} APT (min={min_apt_out:.6f}, "
                     f"slip={slippage}%)"
                 )
-            except Exception as e:
-                logger.warning(f"get_amount_out failed, using 0 min_out: {e}")
-                min_apt_out = 0.0
 
         min_out_raw = _to_octas(min_apt_out, APT_DECIMALS)
         recipient = self.account.address()
@@ -264,7 +286,7 @@ class CellanaDexSwap:
         )
 
         return await self._submit_and_wait(
-            payload, amount_ami, "AMI→APT", t0
+            payload, amount_ami, "AMI→APT", t0, sequence_number
         )
 
     # ------------------------------------------------------------------ #
@@ -376,15 +398,24 @@ class CellanaDexSwap:
         amount_in_human: float,
         label: str,
         t0: float,
+        sequence_number: Optional[int] = None,
     ) -> SwapResult:
         """Build, sign, submit and wait for an on-chain swap transaction.
-        Includes exponential backoff for Rate Limit errors.
+        Includes jittered exponential backoff for Rate Limit errors.
+
+        *sequence_number*, if prefetched, is used for the first attempt
+        only; retries look it up again.
         """
         max_retries = 3
         retry_delay = 1.0  # seconds
 
+        global _rate_limited_until
+
         for attempt in range(max_retries + 1):
             result = SwapResult(amount_in=amount_in_human)
+            wait_s = _rate_limited_until - time.time()
+            if wait_s > 0:
+                await asyncio.sleep(wait_s)
             try:
                 tx_payload = TransactionPayload(entry_fn)
 
@@ -392,6 +423,7 @@ class CellanaDexSwap:
                 signed_tx = await self.client.create_bcs_signed_transaction(
                     sender=self.account,
                     payload=tx_payload,
+                    sequence_number=sequence_number if attempt == 0 else None,
                 )
 
                 # Submit and wait for confirmation
@@ -440,10 +472,19 @@ class CellanaDexSwap:
 
             except Exception as e:
                 err_msg = str(e)
-                # Detect rate limit
-                if "429" in err_msg or "rate limit" in err_msg.lower():
+                # Detect rate limit. The SDK's ApiError carries the HTTP status;
+                # only fall back to the message text for other errors (a bare
+                # "429" can also turn up inside a tx hash or amount).
+                status = getattr(e, "status_code", None)
+                if status is not None:
+                    rate_limited = status == 429
+                else:
+                    rate_limited = "429" in err_msg or "rate limit" in err_msg.lower()
+                if rate_limited:
                     if attempt < max_retries:
-                        wait_time = retry_delay * (2 ** attempt)
+                        # Jittered so concurrent swaps don't all retry at once
+                        wait_time = retry_delay * (2 ** attempt) * random.uniform(0.5, 1.5)
+                        _rate_limited_until = max(_rate_limited_until, time.time() + wait_time)
                         logger.warning(f"⚠️ {label} Rate Limited (attempt {attempt+1}). Retrying in {wait_time:.1f}s...")
                         await asyncio.sleep(wait_time)
                         continue
@@ -1,5 +1,5 @@
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from utils.logger import get_logger
 
@@ -201,10 +201,47 @@ class PriceCollector:
         self._prices[symbol][exchange] = PriceData(
             bid, ask, bid_qty, ask_qty, bids=bids, asks=asks,
         )
-        depth = max(len(bids or []), len(asks or []))
+        # Per-tick line: pass the fields as arguments so loguru only builds
+        # the string when a sink actually accepts DEBUG.
         logger.debug(
-            f"{exchange} {symbol} bid={bid} ask={ask} "
-            f"bid_qty={bid_qty} ask_qty={ask_qty} depth={depth}"
+            "{} {} bid={} ask={} bid_qty={} ask_qty={} depth={}",
+            exchange, symbol, bid, ask, bid_qty, ask_qty,
+            max(len(bids or ()), len(asks or ())),
+        )
+
+    def update_many(
+        self, rows: Iterable[Tuple[str, str, float, float, float, float]]
+    ) -> None:
+        """Store several L1 quotes in one pass.
+
+        Each row is ``(exchange, symbol, bid, ask, bid_qty, ask_qty)``;
+        invalid quotes are skipped as in :meth:`update`.
+        """
+        prices = self._prices
+        for exchange, symbol, bid, ask, bid_qty, ask_qty in rows:
+            if bid <= 0 or ask <= 0:
+                logger.warning(
+                    f"Skip invalid quote from {exchange} {symbol}: bid={bid} ask={ask}"
+                )
+                continue
+            by_exchange = prices.get(symbol)
+            if by_exchange is None:
+                by_exchange = prices[symbol] = {}
+            by_exchange[exchange] = PriceData(bid, ask, bid_qty, ask_qty)
+
+    def clear(self) -> None:
+        """Drop every stored price."""
+        self._prices.clear()
+
+    def load_snapshot(self, snapshot: Dict[str, Dict[str, PriceData]]) -> None:
+        """Replace every stored price with *snapshot* ({symbol: {exchange: PriceData}}).
+
+        Bulk counterpart of :meth:`update` for replaying prebuilt books:
+        no per-quote validation, logging or callback.
+        """
+        self._prices.clear()
+        self._prices.update(
+            (symbol, dict(by_exchange)) for symbol, by_exchange in snapshot.items()
         )
 
     def update_data_age(self, exchange: str, symbol: str) -> None:
@@ -228,5 +265,14 @@ class PriceCollector:
         """Return price data for a specific exchange/symbol, or None."""
         return self._prices.get(symbol, {}).get(exchange)
 
+    def snapshot_cex(
+        self, symbol: str
+    ) -> Tuple[Optional[PriceData], Optional[PriceData]]:
+        """Return (bybit, mexc) price data for *symbol*; either may be None."""
+        by_exchange = self._prices.get(symbol)
+        if not by_exchange:
+            return None, None
+        return by_exchange.get("bybit"), by_exchange.get("mexc")
+
     def get_all_symbols(self) -> list[str]:
         return list(self._prices.keys())
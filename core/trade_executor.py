@@ -177,9 +177,11 @@ class TradeExecutor:
     # ------------------------------------------------------------------ #
     def _emit_signal(self, payload: dict) -> None:
         """Write a structured signal block to console + logs/signals.jsonl."""
-        now = time.time()
+        now_ns = time.time_ns()
+        now = now_ns / 1e9
         payload["dry_run"] = self.dry_run
         payload["ts"]      = now
+        payload["ts_ns"]   = now_ns
         payload["detected_at"] = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
 
         mode_tag = "[DRY-SIGNAL]" if self.dry_run else "[LIVE-SIGNAL]"
@@ -187,7 +189,7 @@ class TradeExecutor:
 
         lines = [f"\n{'━'*56}  {mode_tag}  {time_str}"]
         for k, v in payload.items():
-            if k in ("dry_run", "ts"):
+            if k in ("dry_run", "ts", "ts_ns"):
                 continue
             if isinstance(v, float):
                 lines.append(f"  {k:<22}: {v:.8g}")
@@ -3,6 +3,7 @@ AptosTrader: Handles on-chain transfers from DEX (Aptos wallet) to CEX deposit a
 """
 from typing import Optional, Dict, Any
 from aptos_sdk.account import Account
+from aptos_sdk.account_address import AccountAddress
 from aptos_sdk.async_client import RestClient
 from aptos_sdk.bcs import Serializer
 from aptos_sdk.transactions import (
@@ -10,11 +11,15 @@ from aptos_sdk.transactions import (
     TransactionArgument,
     TransactionPayload,
 )
+from aptos_sdk.type_tag import TypeTag, StructTag
 from config.settings import settings
 from utils.logger import get_logger
 
 logger = get_logger()
 
+# Parsed once — the type argument is the same for every FA transfer
+FA_METADATA_TAG = TypeTag(StructTag.from_str("0x1::fungible_asset::Metadata"))
+
 class AptosTrader:
     def __init__(self):
         self.node_url = settings.aptos_node_url
@@ -23,12 +28,12 @@ class AptosTrader:
         
         # Resource Addresses
         self.ami_fa_address = "0xb36527754eb54d7ff55daf13bcb54b42b88ec484bd6f0e3b2e0d1db169de6451"
+        self.ami_fa_metadata = AccountAddress.from_str(self.ami_fa_address)
         self.apt_addr = "0x1"
 
     async def deposit_apt(self, to_address: str, amount: float) -> Optional[str]:
         """Deposit APT to a CEX address."""
         try:
-            from aptos_sdk.account_address import AccountAddress
             recipient = AccountAddress.from_str(to_address)
             amount_raw = int(amount * 10**8)
             payload = EntryFunction.natural(
@@ -48,17 +53,14 @@ class AptosTrader:
     async def deposit_ami(self, to_address: str, amount: float) -> Optional[str]:
         """Deposit AMI (Fungible Asset) to a CEX address."""
         try:
-            from aptos_sdk.account_address import AccountAddress
             recipient = AccountAddress.from_str(to_address)
-            asset_meta = AccountAddress.from_str(self.ami_fa_address)
             amount_raw = int(amount * 10**8)
-            from aptos_sdk.type_tag import TypeTag, StructTag
             payload = EntryFunction.natural(
                 "0x1::primary_fungible_store",
                 "transfer",
-                [TypeTag(StructTag.from_str("0x1::fungible_asset::Metadata"))],
+                [FA_METADATA_TAG],
                 [
-                    TransactionArgument(asset_meta, Serializer.struct),
+                    TransactionArgument(self.ami_fa_metadata, Serializer.struct),
                     TransactionArgument(recipient, Serializer.struct),
                     TransactionArgument(amount_raw, Serializer.u64),
                 ],
@@ -11,8 +11,15 @@ from config.settings import settings
 from core.price_collector import PriceCollector
 from utils.logger import get_logger
 
+try:
+    import orjson  # optional: faster decode of the orderbook stream
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 _LOG_INTERVAL_S = 15.0  # log Bybit prices at INFO every ~15 seconds
 _FEE_CACHE_TTL_S = 24 * 3600  # 24 hours
 
@@ -70,7 +77,7 @@ class BybitWS:
                 return
             
             # Make HTTP request directly for fee info
-            timestamp = int(time.time() * 1000)
+            timestamp = time.time_ns() // 1_000_000
             params = {
                 "category": "spot",
                 "symbol": settings.cex_symbol,
@@ -224,8 +231,10 @@ class BybitWS:
                 # Reset local books on reconnect
                 self._local_books.clear()
 
+                # No permessage-deflate: frames are small and arrive fast, so
+                # inflating each one costs more CPU than it saves on the wire
                 async with websockets.connect(
-                    BYBIT_WS, open_timeout=20, ping_interval=20
+                    BYBIT_WS, open_timeout=20, ping_interval=20, compression=None
                 ) as ws:
                     reconnect_delay = 1  # reset on successful connect
 
@@ -235,7 +244,7 @@ class BybitWS:
                     logger.info(f"Bybit WS subscribed to {args}")
 
                     async for raw in ws:
-                        msg = json.loads(raw)
+                        msg = _loads(raw)
                         if "data" not in msg:
                             continue
 
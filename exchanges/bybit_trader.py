@@ -12,10 +12,18 @@ from typing import Optional, Dict, Any, List
 from config.settings import settings
 from utils.logger import get_logger
 
+try:
+    import orjson  # optional: faster order-body serialisation / response decode
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 BASE_URL = "https://api.bybit.com"
 RECV_WINDOW = 10000  # Increased for better resilience during withdrawals
+RECV_WINDOW_STR = str(RECV_WINDOW)
 
 @dataclass
 class OrderResult:
@@ -28,38 +36,49 @@ class BybitTrader:
     def __init__(self):
         self.api_key = settings.bybit_api_key
         self.api_secret = settings.bybit_api_secret
+        # Keyed HMAC state, copied per request instead of re-keying every time
+        self._signer = hmac.new((self.api_secret or "").encode(), digestmod=hashlib.sha256)
+        self._api_key_b = (self.api_key or "").encode()
         self._time_offset_ms: int = 0
         self._last_sync_ts: float = 0.0
         self.instrument_info: Dict[str, dict] = {}
+        # Persistent aiohttp session (avoid a TCP+TLS handshake per request)
+        self._http_session: Optional[aiohttp.ClientSession] = None
 
     def _is_configured(self) -> bool:
         return bool(self.api_key and self.api_secret)
 
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Lazy-init and return persistent aiohttp session."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
     async def get_server_time(self) -> int:
         """Fetch current Bybit server time directly."""
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/v5/market/time",
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    data = await resp.json()
-                return int(data.get("time", 0))
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/v5/market/time",
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                data = await resp.json(loads=_loads)
+            return int(data.get("time", 0))
         except Exception as e:
             logger.warning(f"Failed to fetch Bybit server time: {e}")
-            return int(time.time() * 1000)
+            return time.time_ns() // 1_000_000
 
     async def sync_server_time(self) -> None:
         """Fetch Bybit server time and compute clock offset."""
         try:
-            async with aiohttp.ClientSession() as session:
-                t0 = int(time.time() * 1000)
-                async with session.get(
-                    f"{BASE_URL}/v5/market/time",
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    data = await resp.json()
-                t1 = int(time.time() * 1000)
+            session = await self._get_http_session()
+            t0 = time.time_ns() // 1_000_000
+            async with session.get(
+                f"{BASE_URL}/v5/market/time",
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                data = await resp.json(loads=_loads)
+            t1 = time.time_ns() // 1_000_000
 
             server_ts = int(data.get("time", 0))
             if server_ts > 0:
@@ -100,27 +119,27 @@ class BybitTrader:
                 unified_params += f"&coin={search_coins[0]}"
             
             ts = self._now_ms()
-            sig = self._sign(ts, str(RECV_WINDOW), unified_params)
+            sig = self._sign(ts, RECV_WINDOW_STR, unified_params)
             h = {
                 "X-BAPI-API-KEY": self.api_key,
                 "X-BAPI-SIGN": sig,
                 "X-BAPI-SIGN-TYPE": "2",
                 "X-BAPI-TIMESTAMP": ts,
-                "X-BAPI-RECV-WINDOW": str(RECV_WINDOW),
+                "X-BAPI-RECV-WINDOW": RECV_WINDOW_STR,
             }
 
-            async with aiohttp.ClientSession() as session:
-                url_params = {"accountType": "UNIFIED"}
-                if len(search_coins) == 1:
-                    url_params["coin"] = search_coins[0]
+            session = await self._get_http_session()
+            url_params = {"accountType": "UNIFIED"}
+            if len(search_coins) == 1:
+                url_params["coin"] = search_coins[0]
                 
-                async with session.get(
-                    f"{BASE_URL}/v5/account/wallet-balance",
-                    headers=h,
-                    params=url_params,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    data = await resp.json()
+            async with session.get(
+                f"{BASE_URL}/v5/account/wallet-balance",
+                headers=h,
+                params=url_params,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                data = await resp.json(loads=_loads)
 
             if data.get("retCode") == 0:
                 list_data = data.get("result", {}).get("list", [])
@@ -144,27 +163,27 @@ class BybitTrader:
                 fund_params += f"&coin={search_coins[0]}"
             
             ts = self._now_ms()
-            sig = self._sign(ts, str(RECV_WINDOW), fund_params)
+            sig = self._sign(ts, RECV_WINDOW_STR, fund_params)
             h = {
                 "X-BAPI-API-KEY": self.api_key,
                 "X-BAPI-SIGN": sig,
                 "X-BAPI-SIGN-TYPE": "2",
                 "X-BAPI-TIMESTAMP": ts,
-                "X-BAPI-RECV-WINDOW": str(RECV_WINDOW),
+                "X-BAPI-RECV-WINDOW": RECV_WINDOW_STR,
             }
 
-            async with aiohttp.ClientSession() as session:
-                url_params = {"accountType": "FUND"}
-                if len(search_coins) == 1:
-                    url_params["coin"] = search_coins[0]
+            session = await self._get_http_session()
+            url_params = {"accountType": "FUND"}
+            if len(search_coins) == 1:
+                url_params["coin"] = search_coins[0]
                 
-                async with session.get(
-                    f"{BASE_URL}{fund_endpoint}",
-                    headers=h,
-                    params=url_params,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    fund_data = await resp.json()
+            async with session.get(
+                f"{BASE_URL}{fund_endpoint}",
+                headers=h,
+                params=url_params,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                fund_data = await resp.json(loads=_loads)
 
             if fund_data.get("retCode") == 0:
                 result = fund_data.get("result", {})
@@ -203,23 +222,23 @@ class BybitTrader:
             fund_endpoint = "/v5/asset/transfer/query-account-coins-balance"
             fund_params = "accountType=FUND"
             ts = self._now_ms()
-            sig = self._sign(ts, str(RECV_WINDOW), fund_params)
+            sig = self._sign(ts, RECV_WINDOW_STR, fund_params)
             h = {
                 "X-BAPI-API-KEY": self.api_key,
                 "X-BAPI-SIGN": sig,
                 "X-BAPI-SIGN-TYPE": "2",
                 "X-BAPI-TIMESTAMP": ts,
-                "X-BAPI-RECV-WINDOW": str(RECV_WINDOW),
+                "X-BAPI-RECV-WINDOW": RECV_WINDOW_STR,
             }
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}{fund_endpoint}",
-                    headers=h,
-                    params={"accountType": "FUND"},
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    fund_data = await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}{fund_endpoint}",
+                headers=h,
+                params={"accountType": "FUND"},
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                fund_data = await resp.json(loads=_loads)
 
             if fund_data.get("retCode") == 0:
                 result = fund_data.get("result", {})
@@ -243,26 +262,29 @@ class BybitTrader:
         # Using a slightly laggy timestamp (-5s) can help bypass "future window" errors
         # but sensitive endpoints (Withdraw) need it closer to server time.
         offset = 0 if sensitive else -5000
-        return str(int(time.time() * 1000) + self._time_offset_ms + offset)
+        return str(time.time_ns() // 1_000_000 + self._time_offset_ms + offset)
 
-    def _sign(self, timestamp: Any, recv_window: Any, payload: str) -> str:
+    def _sign(self, timestamp: Any, recv_window: Any, payload: str | bytes) -> str:
         """Create Bybit V5 signature: timestamp + api_key + recv_window + payload"""
-        param_str = f"{timestamp}{self.api_key}{recv_window}{payload}"
         # DEBUG: Hidden API Key for security
+        if isinstance(payload, bytes):
+            payload_b, payload = payload, payload.decode()
+        else:
+            payload_b = payload.encode()
         logger.debug(f"BYBIT SIGN STRING: {timestamp}API_KEY_HIDDEN{recv_window}{payload}")
-        hash = hmac.new(
-            bytes(self.api_secret, "utf-8"),
-            bytes(param_str, "utf-8"),
-            hashlib.sha256
-        )
-        return hash.hexdigest()
+        mac = self._signer.copy()
+        mac.update(str(timestamp).encode())
+        mac.update(self._api_key_b)
+        mac.update(str(recv_window).encode())
+        mac.update(payload_b)
+        return mac.hexdigest()
 
     async def _poll_order_fill(self, symbol: str, order_id: str, max_polls: int = 15) -> Optional[OrderResult]:
         for i in range(max_polls):
             await asyncio.sleep(0.5)
             params = f"category=spot&symbol={symbol}&orderId={order_id}"
             timestamp = self._now_ms()
-            recv_window = str(RECV_WINDOW)
+            recv_window = RECV_WINDOW_STR
             signature = self._sign(timestamp, recv_window, params)
 
             headers = {
@@ -274,14 +296,14 @@ class BybitTrader:
             }
 
             try:
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{BASE_URL}/v5/order/history",
-                        headers=headers,
-                        params={"category": "spot", "symbol": symbol, "orderId": order_id},
-                        timeout=aiohttp.ClientTimeout(total=5)
-                    ) as resp:
-                        data = await resp.json()
+                session = await self._get_http_session()
+                async with session.get(
+                    f"{BASE_URL}/v5/order/history",
+                    headers=headers,
+                    params={"category": "spot", "symbol": symbol, "orderId": order_id},
+                    timeout=aiohttp.ClientTimeout(total=5)
+                ) as resp:
+                    data = await resp.json(loads=_loads)
 
                 if data.get("retCode") == 0:
                     rows = data.get("result", {}).get("list", [])
@@ -308,13 +330,13 @@ class BybitTrader:
         """Fetch lotSizeFilter (precision) for a symbol from Bybit V5."""
         try:
             params = {"category": "spot", "symbol": symbol}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/v5/market/instruments-info",
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/v5/market/instruments-info",
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                data = await resp.json(loads=_loads)
             
             if data.get("retCode") == 0:
                 list_data = data.get("result", {}).get("list", [])
@@ -445,10 +467,13 @@ class BybitTrader:
         if side.upper() == "BUY" and market_unit:
             body_dict["marketUnit"] = market_unit
 
-        body_str = json.dumps(body_dict, separators=(",", ":"))
+        if orjson is not None:
+            body = orjson.dumps(body_dict)  # bytes: signed and sent as-is
+        else:
+            body = json.dumps(body_dict, separators=(",", ":"))
         timestamp = self._now_ms()
-        recv_window = str(RECV_WINDOW)
-        signature = self._sign(timestamp, recv_window, body_str)
+        recv_window = RECV_WINDOW_STR
+        signature = self._sign(timestamp, recv_window, body)
 
         headers = {
             "X-BAPI-API-KEY": self.api_key,
@@ -460,21 +485,21 @@ class BybitTrader:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{BASE_URL}/v5/order/create",
-                    headers=headers,
-                    data=body_str,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.post(
+                f"{BASE_URL}/v5/order/create",
+                headers=headers,
+                data=body,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                data = await resp.json(loads=_loads)
 
             if data.get("retCode") == 0:
                 order_id = data.get("result", {}).get("orderId", "?")
                 logger.success(f"✅ Bybit order placed | {side} {qty_str} {symbol}")
                 return await self._poll_order_fill(symbol, order_id)
             else:
-                logger.error(f"❌ Bybit order failed | {data.get('retMsg')} | Payload: {body_str} | Data: {data}")
+                logger.error(f"❌ Bybit order failed | {data.get('retMsg')} | Payload: {body.decode() if isinstance(body, bytes) else body} | Data: {data}")
                 return None
         except Exception as e:
             logger.error(f"Bybit order exception: {e}")
@@ -494,18 +519,18 @@ class BybitTrader:
         
         try:
             transfer_id = str(uuid.uuid4())
+            ts_ms = self._now_ms(sensitive=True)
             body_dict = {
                 "transferId": transfer_id,
                 "coin": coin.upper(),
                 "amount": str(rounded_amount),
                 "fromAccountType": from_account,
                 "toAccountType": to_account,
-                "timestamp": int(self._now_ms(sensitive=True)),
+                "timestamp": int(ts_ms),
             }
             
             b_str = json.dumps(body_dict, separators=(",", ":"))
-            ts_ms = str(body_dict["timestamp"])
-            recv_w = str(RECV_WINDOW)
+            recv_w = RECV_WINDOW_STR
             sig = self._sign(ts_ms, recv_w, b_str)
             
             h = {
@@ -518,14 +543,14 @@ class BybitTrader:
             }
             
             logger.info(f"🔄 Bybit internal transfer: {rounded_amount} {coin.upper()} {from_account} -> {to_account}")
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{BASE_URL}/v5/asset/transfer/inter-transfer",
-                    headers=h,
-                    data=b_str,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.post(
+                f"{BASE_URL}/v5/asset/transfer/inter-transfer",
+                headers=h,
+                data=b_str,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                data = await resp.json(loads=_loads)
                     
             if data.get("retCode") == 0:
                 logger.success(f"✅ Bybit internal transfer successful: {transfer_id}")
@@ -578,7 +603,7 @@ class BybitTrader:
                 body_dict["tag"] = tag
 
             b_str = json.dumps(body_dict, separators=(",", ":"))
-            recv_w = str(RECV_WINDOW)
+            recv_w = RECV_WINDOW_STR
             sig = self._sign(ts_ms, recv_w, b_str)
 
             h = {
@@ -591,21 +616,21 @@ class BybitTrader:
             }
             
             logger.debug(f"🔍 [Bybit Internal] Request Details:")
-            logger.debug(f"   - Timestamp: {ts_ms} (Local Unix: {int(time.time()*1000)})")
+            logger.debug(f"   - Timestamp: {ts_ms} (Local Unix: {time.time_ns() // 1_000_000})")
             logger.debug(f"   - RecvWindow: {recv_w}")
             logger.debug(f"   - Body: {b_str}")
             logger.debug(f"   - Signature: {sig}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{BASE_URL}/v5/asset/withdraw/create",
-                    headers=h,
-                    data=b_str,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status != 200:
-                        return None, await resp.text(), resp.status
-                    return await resp.json(), None, 200
+            session = await self._get_http_session()
+            async with session.post(
+                f"{BASE_URL}/v5/asset/withdraw/create",
+                headers=h,
+                data=b_str,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                if resp.status != 200:
+                    return None, await resp.text(), resp.status
+                return await resp.json(loads=_loads), None, 200
             
             return None, "Unexpected flow", 500
 
@@ -615,22 +640,22 @@ class BybitTrader:
             try:
                 # Query FUND balance specifically
                 ts_bal = self._now_ms()
-                sig_bal = self._sign(ts_bal, str(RECV_WINDOW), f"accountType=FUND&coin={coin}")
+                sig_bal = self._sign(ts_bal, RECV_WINDOW_STR, f"accountType=FUND&coin={coin}")
                 h_bal = {
                     "X-BAPI-API-KEY": self.api_key,
                     "X-BAPI-SIGN": sig_bal,
                     "X-BAPI-SIGN-TYPE": "2",
                     "X-BAPI-TIMESTAMP": ts_bal,
-                    "X-BAPI-RECV-WINDOW": str(RECV_WINDOW),
+                    "X-BAPI-RECV-WINDOW": RECV_WINDOW_STR,
                 }
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{BASE_URL}/v5/asset/transfer/query-account-coin-balance",
-                        headers=h_bal,
-                        params={"accountType": "FUND", "coin": coin},
-                        timeout=aiohttp.ClientTimeout(total=10)
-                    ) as resp:
-                        bal_data = await resp.json()
+                session = await self._get_http_session()
+                async with session.get(
+                    f"{BASE_URL}/v5/asset/transfer/query-account-coin-balance",
+                    headers=h_bal,
+                    params={"accountType": "FUND", "coin": coin},
+                    timeout=aiohttp.ClientTimeout(total=10)
+                ) as resp:
+                    bal_data = await resp.json(loads=_loads)
                 
                 fund_bal = 0.0
                 if bal_data.get("retCode") == 0:
@@ -646,25 +671,25 @@ class BybitTrader:
                         # Re-verify FUND balance
                         try:
                             ts_v = self._now_ms()
-                            sig_v = self._sign(ts_v, str(RECV_WINDOW), f"accountType=FUND&coin={coin}")
+                            sig_v = self._sign(ts_v, RECV_WINDOW_STR, f"accountType=FUND&coin={coin}")
                             h_v = {
                                 "X-BAPI-API-KEY": self.api_key,
                                 "X-BAPI-SIGN": sig_v,
                                 "X-BAPI-SIGN-TYPE": "2",
                                 "X-BAPI-TIMESTAMP": ts_v,
-                                "X-BAPI-RECV-WINDOW": str(RECV_WINDOW),
+                                "X-BAPI-RECV-WINDOW": RECV_WINDOW_STR,
                             }
-                            async with aiohttp.ClientSession() as session:
-                                async with session.get(
-                                    f"{BASE_URL}/v5/asset/transfer/query-account-coin-balance",
-                                    headers=h_v,
-                                    params={"accountType": "FUND", "coin": coin},
-                                    timeout=aiohttp.ClientTimeout(total=5)
-                                ) as resp:
-                                    v_data = await resp.json()
-                                    if v_data.get("retCode") == 0:
-                                        new_fund_bal = float(v_data.get("result", {}).get("balance", {}).get("walletBalance", 0.0))
-                                        logger.info(f"📊 [Bybit] Verified FUND balance: {new_fund_bal}")
+                            session = await self._get_http_session()
+                            async with session.get(
+                                f"{BASE_URL}/v5/asset/transfer/query-account-coin-balance",
+                                headers=h_v,
+                                params={"accountType": "FUND", "coin": coin},
+                                timeout=aiohttp.ClientTimeout(total=5)
+                            ) as resp:
+                                v_data = await resp.json(loads=_loads)
+                                if v_data.get("retCode") == 0:
+                                    new_fund_bal = float(v_data.get("result", {}).get("balance", {}).get("walletBalance", 0.0))
+                                    logger.info(f"📊 [Bybit] Verified FUND balance: {new_fund_bal}")
                         except Exception as ve:
                             logger.warning(f"Bybit post-transfer balance verification failed: {ve}")
                     else:
@@ -686,7 +711,7 @@ class BybitTrader:
                     await asyncio.sleep(10.5)
                     
                     # Retry with exactly synced server time
-                    retry_ts = str(int(time.time() * 1000) + self._time_offset_ms)
+                    retry_ts = str(time.time_ns() // 1_000_000 + self._time_offset_ms)
                     logger.info(f"🔄 Retrying with precise timestamp: {retry_ts}")
                     data, err_text, status = await _perform_withdraw(retry_ts)
 
@@ -725,7 +750,7 @@ class BybitTrader:
 
         params_str = urllib.parse.urlencode(params)
         timestamp = self._now_ms()
-        recv_window = str(RECV_WINDOW)
+        recv_window = RECV_WINDOW_STR
         signature = self._sign(timestamp, recv_window, params_str)
 
         headers = {
@@ -737,18 +762,18 @@ class BybitTrader:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/v5/asset/deposit/query-address",
-                    headers=headers,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    if resp.status != 200:
-                        err_text = await resp.text()
-                        logger.error(f"❌ Bybit get_deposit_address HTTP error {resp.status}: {err_text}")
-                        return None
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/v5/asset/deposit/query-address",
+                headers=headers,
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                if resp.status != 200:
+                    err_text = await resp.text()
+                    logger.error(f"❌ Bybit get_deposit_address HTTP error {resp.status}: {err_text}")
+                    return None
+                data = await resp.json(loads=_loads)
 
             if data and data.get("retCode") == 0:
                 rows = data.get("result", {}).get("rows", [])
@@ -794,27 +819,28 @@ class BybitTrader:
         if not self.api_key or not self.api_secret: return None
         await self._ensure_time_synced()
         ts = self._now_ms() # Standard sync is fine for info query
-        params = {"timestamp": ts, "recvWindow": str(RECV_WINDOW)}
+        params = {"timestamp": ts, "recvWindow": RECV_WINDOW_STR}
         query_str = urllib.parse.urlencode(params)
-        sig = self._sign(str(ts), str(RECV_WINDOW), "")
+        sig = self._sign(str(ts), RECV_WINDOW_STR, "")
         
         try:
-            async with aiohttp.ClientSession() as session:
-                h = {
-                    "X-BAPI-API-KEY": self.api_key,
-                    "X-BAPI-SIGN": sig,
-                    "X-BAPI-TIMESTAMP": str(ts),
-                    "X-BAPI-RECV-WINDOW": str(RECV_WINDOW)
-                }
-                async with session.get(
-                    f"{BASE_URL}/v5/user/query-api",
-                    headers=h,
-                    timeout=aiohttp.ClientTimeout(total=10)
-                ) as resp:
-                    return await resp.json()
+            session = await self._get_http_session()
+            h = {
+                "X-BAPI-API-KEY": self.api_key,
+                "X-BAPI-SIGN": sig,
+                "X-BAPI-TIMESTAMP": str(ts),
+                "X-BAPI-RECV-WINDOW": RECV_WINDOW_STR
+            }
+            async with session.get(
+                f"{BASE_URL}/v5/user/query-api",
+                headers=h,
+                timeout=aiohttp.ClientTimeout(total=10)
+            ) as resp:
+                return await resp.json(loads=_loads)
         except Exception as e:
             logger.error(f"Bybit get_api_key_info exception: {e}")
             return None
 
     async def close(self) -> None:
-        pass
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
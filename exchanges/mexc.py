@@ -8,6 +8,11 @@ from config.settings import settings
 from core.price_collector import PriceCollector
 from utils.logger import get_logger
 
+try:
+    import orjson  # optional: faster decode of polled tickers
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
 _LOG_INTERVAL_S = 15.0  # log MEXC prices at INFO every ~15 seconds
@@ -70,7 +75,7 @@ class MexcWS:
                 had_fallback = False
 
                 for symbol in symbols_to_fetch:
-                    timestamp = int(time.time() * 1000)
+                    timestamp = time.time_ns() // 1_000_000
                     params = {
                         "timestamp": timestamp,
                         "recvWindow": 5000,
@@ -209,11 +214,17 @@ class MexcWS:
             logger.debug("MEXC WS PONG received")
 
     def _process_ticker_data(self, symbol: str, data: dict) -> None:
-        bid = float(data.get("b", 0))
-        ask = float(data.get("a", 0))
-        bid_qty = float(data.get("B", 0))
-        ask_qty = float(data.get("A", 0))
+        self._apply_ticker(
+            symbol,
+            float(data.get("b", 0)),
+            float(data.get("a", 0)),
+            float(data.get("B", 0)),
+            float(data.get("A", 0)),
+        )
 
+    def _apply_ticker(
+        self, symbol: str, bid: float, ask: float, bid_qty: float, ask_qty: float
+    ) -> None:
         if bid > 0 and ask > 0:
             self.collector.update(
                 "mexc", symbol, bid, ask, bid_qty, ask_qty
@@ -259,32 +270,43 @@ class MexcWS:
     async def _rest_polling_loop(self) -> None:
         """Fetch prices via REST API periodically for each symbol."""
         base_url = f"{MEXC_REST}/api/v3/ticker/bookTicker"
-        
-        while True:
-            if time.time() < self._backoff_until:
-                await asyncio.sleep(0.5)
-                continue
-                
-            try:
-                async with aiohttp.ClientSession() as session:
-                    for symbol in self.symbols:
-                        url = f"{base_url}?symbol={symbol.upper()}"
-                        async with session.get(url, timeout=5) as resp:
-                            if resp.status == 200:
-                                t = await resp.json()
-                                await self._handle_rest_ticker(t)
-                            elif resp.status == 429:
-                                self._handle_429(resp.headers)
-                                break # Stop current cycle on 429
-                            elif resp.status == 400:
-                                # Often happens if symbol is invalid or not found on MEXC
-                                logger.warning(f"MEXC REST Polling 400 for {symbol}: invalid symbol?")
-                            else:
-                                logger.warning(f"MEXC REST Polling status {resp.status} for {symbol}")
-            except Exception as e:
-                logger.warning(f"MEXC REST Polling error: {e}")
-            
-            await asyncio.sleep(self._rest_polling_interval)
+
+        # One session for the life of the loop: a fresh one per 500ms cycle
+        # meant a new TCP+TLS handshake (and DNS lookup) on every poll.
+        connector = aiohttp.TCPConnector(keepalive_timeout=60, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            while True:
+                if time.time() < self._backoff_until:
+                    await asyncio.sleep(0.5)
+                    continue
+
+                try:
+                    # Symbols are independent — one round-trip per cycle, not one per symbol
+                    await asyncio.gather(
+                        *(self._poll_symbol(session, base_url, s) for s in self.symbols)
+                    )
+                except Exception as e:
+                    logger.warning(f"MEXC REST Polling error: {e}")
+
+                await asyncio.sleep(self._rest_polling_interval)
+
+    async def _poll_symbol(self, session: aiohttp.ClientSession, base_url: str, symbol: str) -> None:
+        """Fetch one bookTicker and feed it to the collector."""
+        url = f"{base_url}?symbol={symbol.upper()}"
+        async with session.get(url, timeout=5) as resp:
+            if resp.status == 200:
+                if orjson is not None:
+                    t = orjson.loads(await resp.read())
+                else:
+                    t = await resp.json()
+                await self._handle_rest_ticker(t)
+            elif resp.status == 429:
+                self._handle_429(resp.headers)
+            elif resp.status == 400:
+                # Often happens if symbol is invalid or not found on MEXC
+                logger.warning(f"MEXC REST Polling 400 for {symbol}: invalid symbol?")
+            else:
+                logger.warning(f"MEXC REST Polling status {resp.status} for {symbol}")
 
     async def _periodic_fee_refresh(self) -> None:
         """Refresh fees every few hours."""
@@ -295,14 +317,14 @@ class MexcWS:
     async def _handle_rest_ticker(self, ticker: dict) -> None:
         """Parse ticker data from REST response."""
         # MEXC REST Format: {"symbol": "AMIUSDT", "bidPrice": "...", "bidQty": "...", "askPrice": "...", "askQty": "..."}
-        symbol = ticker.get("symbol")
-        data = {
-            "b": ticker.get("bidPrice"),
-            "a": ticker.get("askPrice"),
-            "B": ticker.get("bidQty"),
-            "A": ticker.get("askQty")
-        }
-        self._process_ticker_data(symbol, data)
+        # Convert straight from the REST fields — no intermediate WS-shaped dict
+        self._apply_ticker(
+            ticker.get("symbol"),
+            float(ticker.get("bidPrice") or 0),
+            float(ticker.get("askPrice") or 0),
+            float(ticker.get("bidQty") or 0),
+            float(ticker.get("askQty") or 0),
+        )
 
     def _handle_429(self, headers: dict) -> None:
         """Handle Rate Limit (429) from MEXC."""
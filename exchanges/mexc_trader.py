@@ -4,6 +4,7 @@ MEXC spot order executor using REST API v3.
 import asyncio
 import hashlib
 import hmac
+import json
 import time
 import urllib.parse
 from dataclasses import dataclass
@@ -14,8 +15,15 @@ import aiohttp
 from config.settings import settings
 from utils.logger import get_logger
 
+try:
+    import orjson  # optional: faster response decode
+except ImportError:
+    orjson = None
+
 logger = get_logger()
 
+_loads = orjson.loads if orjson is not None else json.loads
+
 BASE_URL = "https://api.mexc.com"
 
 
@@ -40,25 +48,35 @@ class MexcTrader:
     def __init__(self) -> None:
         self.api_key = settings.mexc_api_key
         self.api_secret = settings.mexc_api_secret
+        # Keyed HMAC state, copied per request instead of re-keying every time
+        self._signer = hmac.new((self.api_secret or "").encode(), digestmod=hashlib.sha256)
         # Offset (ms) = server_time - local_time
         self._time_offset_ms: int = 0
         self._last_sync_ts: float = 0.0
         self.instrument_info: Dict[str, dict] = {}
+        # Persistent aiohttp session (avoid a TCP+TLS handshake per request)
+        self._http_session: Optional[aiohttp.ClientSession] = None
 
     def _is_configured(self) -> bool:
         return bool(self.api_key and self.api_secret)
 
+    async def _get_http_session(self) -> aiohttp.ClientSession:
+        """Lazy-init and return persistent aiohttp session."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
     async def sync_server_time(self) -> None:
         """Fetch MEXC server time and compute clock offset."""
         try:
-            async with aiohttp.ClientSession() as session:
-                t0 = int(time.time() * 1000)
-                async with session.get(
-                    f"{BASE_URL}/api/v3/time",
-                    timeout=aiohttp.ClientTimeout(total=5),
-                ) as resp:
-                    data = await resp.json()
-                t1 = int(time.time() * 1000)
+            session = await self._get_http_session()
+            t0 = time.time_ns() // 1_000_000
+            async with session.get(
+                f"{BASE_URL}/api/v3/time",
+                timeout=aiohttp.ClientTimeout(total=5),
+            ) as resp:
+                data = await resp.json(loads=_loads)
+            t1 = time.time_ns() // 1_000_000
 
             server_ts = int(data.get("serverTime", 0))
             if server_ts > 0:
@@ -81,14 +99,12 @@ class MexcTrader:
 
     def _now_ms(self) -> str:
         """Return current timestamp (ms) adjusted by server offset."""
-        return str(int(time.time() * 1000) + self._time_offset_ms)
+        return str(time.time_ns() // 1_000_000 + self._time_offset_ms)
 
     def _sign(self, query_string: str) -> str:
-        return hmac.new(
-            self.api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        mac = self._signer.copy()
+        mac.update(query_string.encode("utf-8"))
+        return mac.hexdigest()
 
     async def get_balance(self, coins: list[str] | str | None = None) -> Dict[str, float]:
         """Fetch balances for specific coins (via REST)."""
@@ -107,14 +123,14 @@ class MexcTrader:
         params["signature"] = self._sign(query_string)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/api/v3/account",
-                    params=params,
-                    headers={"X-MEXC-APIKEY": self.api_key},
-                    timeout=aiohttp.ClientTimeout(total=20),
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/api/v3/account",
+                params=params,
+                headers={"X-MEXC-APIKEY": self.api_key},
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                data = await resp.json(loads=_loads)
 
             if "code" in data and data["code"] != 200:
                 # Auto-resync clock on timestamp error and retry once
@@ -126,14 +142,14 @@ class MexcTrader:
                     params = {"timestamp": timestamp, "recvWindow": str(_RECV_WINDOW_MS)}
                     query_string = urllib.parse.urlencode(params)
                     params["signature"] = self._sign(query_string)
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            f"{BASE_URL}/api/v3/account",
-                            params=params,
-                            headers={"X-MEXC-APIKEY": self.api_key},
-                            timeout=aiohttp.ClientTimeout(total=20),
-                        ) as resp:
-                            data = await resp.json()
+                    session = await self._get_http_session()
+                    async with session.get(
+                        f"{BASE_URL}/api/v3/account",
+                        params=params,
+                        headers={"X-MEXC-APIKEY": self.api_key},
+                        timeout=aiohttp.ClientTimeout(total=20),
+                    ) as resp:
+                        data = await resp.json(loads=_loads)
                     if "code" in data and data["code"] != 200:
                         logger.error(
                             f"MexcTrader.get_balance error after resync: code={data.get('code')} "
@@ -183,14 +199,14 @@ class MexcTrader:
                 query_string = urllib.parse.urlencode(params)
                 params["signature"] = self._sign(query_string)
 
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(
-                        f"{BASE_URL}/api/v3/order",
-                        params=params,
-                        headers={"X-MEXC-APIKEY": self.api_key},
-                        timeout=aiohttp.ClientTimeout(total=5),
-                    ) as resp:
-                        data = await resp.json()
+                session = await self._get_http_session()
+                async with session.get(
+                    f"{BASE_URL}/api/v3/order",
+                    params=params,
+                    headers={"X-MEXC-APIKEY": self.api_key},
+                    timeout=aiohttp.ClientTimeout(total=5),
+                ) as resp:
+                    data = await resp.json(loads=_loads)
 
                 status = data.get("status", "")
                 exec_qty = float(data.get("executedQty", 0))
@@ -228,13 +244,13 @@ class MexcTrader:
         """Fetch baseAssetPrecision for a symbol from MEXC V3."""
         try:
             params = {"symbol": symbol}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/api/v3/exchangeInfo",
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=5)
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/api/v3/exchangeInfo",
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=5)
+            ) as resp:
+                data = await resp.json(loads=_loads)
             
             if "symbols" in data:
                 for s_info in data["symbols"]:
@@ -282,51 +298,44 @@ class MexcTrader:
 
         # Round quantity to exchange precision
         # Note: MEXC BUY with is_quote_qty uses quote asset (USDT)
+        info = self.instrument_info.get(symbol)
         if is_quote_qty:
             # For USDT, 2 decimal places is usually safe, 
             # or we could use quotePrecision from instrument_info
-            info = self.instrument_info.get(symbol)
-            q_prec = info.get("quotePrecision", 2) if info else 2
-            factor = 10 ** q_prec
+            prec = info.get("quotePrecision", 2) if info else 2
+            factor = 10 ** prec
             qty = float(int(qty * factor) / factor)
         else:
+            prec = info.get("baseAssetPrecision", 2) if info else 2
             qty = self.round_quantity(symbol, qty)
             
         if qty <= 0:
             logger.error(f"❌ MEXC order aborted: quantity {qty} is too small after rounding.")
             return None
 
-        timestamp = self._now_ms()
-        params: dict = {
-            "symbol": symbol,
-            "side": side,
-            "type": "MARKET",
-            "timestamp": timestamp,
-            "recvWindow": str(_RECV_WINDOW_MS),
-        }
-        if is_quote_qty:
-            params["quoteOrderQty"] = f"{qty:g}"
-        else:
-            params["quantity"] = f"{qty:g}"
-
-        query_string = urllib.parse.urlencode(params)
+        # Fixed-point at the symbol's precision, never exponent form: a "+"
+        # in "1e+06" would reach the server as a space.  The string signed
+        # below is exactly the one sent on the URL.
+        qty_str = format(qty, f".{prec}f").rstrip("0").rstrip(".")
+        qty_key = "quoteOrderQty" if is_quote_qty else "quantity"
+        query_string = (
+            f"symbol={symbol}&side={side}&type=MARKET"
+            f"&timestamp={self._now_ms()}&recvWindow={_RECV_WINDOW_MS}"
+            f"&{qty_key}={qty_str}"
+        )
         signature = self._sign(query_string)
-        params["signature"] = signature
-
-        headers = {"X-MEXC-APIKEY": self.api_key}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{BASE_URL}/api/v3/order",
-                    headers={
-                        "X-MEXC-APIKEY": self.api_key,
-                        "Content-Type": "application/json",
-                    },
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=20),
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.post(
+                f"{BASE_URL}/api/v3/order?{query_string}&signature={signature}",
+                headers={
+                    "X-MEXC-APIKEY": self.api_key,
+                    "Content-Type": "application/json",
+                },
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                data = await resp.json(loads=_loads)
 
             if "orderId" in data:
                 order_id = str(data["orderId"])
@@ -381,19 +390,19 @@ class MexcTrader:
         params["signature"] = self._sign(query_string)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                # Last resort attempt: explicit JSON content type and body
-                h = {
-                    "X-MEXC-APIKEY": self.api_key,
-                    "Content-Type": "application/json"
-                }
-                async with session.post(
-                    f"{BASE_URL}/api/v3/capital/withdraw/apply",
-                    headers=h,
-                    params=params, # MEXC sometimes wants it in both or either
-                    timeout=aiohttp.ClientTimeout(total=20),
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            # Last resort attempt: explicit JSON content type and body
+            h = {
+                "X-MEXC-APIKEY": self.api_key,
+                "Content-Type": "application/json"
+            }
+            async with session.post(
+                f"{BASE_URL}/api/v3/capital/withdraw/apply",
+                headers=h,
+                params=params, # MEXC sometimes wants it in both or either
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                data = await resp.json(loads=_loads)
 
             if "id" in data:
                 withdraw_id = str(data["id"])
@@ -428,14 +437,14 @@ class MexcTrader:
         params["signature"] = self._sign(query_string)
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/api/v3/capital/deposit/address",
-                    headers={"X-MEXC-APIKEY": self.api_key},
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=20),
-                ) as resp:
-                    data = await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/api/v3/capital/deposit/address",
+                headers={"X-MEXC-APIKEY": self.api_key},
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                data = await resp.json(loads=_loads)
 
             logger.debug(f"🔍 [MEXC] Deposit response for {coin}: {data}")
 
@@ -464,20 +473,19 @@ class MexcTrader:
         query_string = urllib.parse.urlencode(params)
         params["signature"] = self._sign(query_string)
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{BASE_URL}/api/v3/capital/config/getall",
-                    headers={"X-MEXC-APIKEY": self.api_key},
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=20),
-                ) as resp:
-                    return await resp.json()
+            session = await self._get_http_session()
+            async with session.get(
+                f"{BASE_URL}/api/v3/capital/config/getall",
+                headers={"X-MEXC-APIKEY": self.api_key},
+                params=params,
+                timeout=aiohttp.ClientTimeout(total=20),
+            ) as resp:
+                return await resp.json(loads=_loads)
         except Exception as e:
             logger.error(f"MEXC get_all_assets_info extension: {e}")
             return None
 
     async def close(self) -> None:
         """Cleanup resources."""
-        # MexcTrader currently creates a new session per request,
-        # but we provide this for consistency with other traders.
-        pass
+        if self._http_session and not self._http_session.closed:
+            await self._http_session.close()
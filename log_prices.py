@@ -5,6 +5,11 @@ from exchanges.bybit import BybitWS
 from exchanges.mexc import MexcWS
 from utils.logger import get_logger
 
+try:
+    import uvloop  # optional: faster event loop
+except ImportError:
+    uvloop = None
+
 logger = get_logger()
 
 async def log_prices():
@@ -15,45 +20,33 @@ async def log_prices():
     logger.info("=" * 80)
     
     collector = PriceCollector()
-    
-    # Bybit
-    try:
-        logger.info("\n📊 BYBIT")
-        bybit = BybitWS(collector=collector, symbols=[settings.cex_symbol])
-        # Start bybit in background and let it collect one update
-        bybit_task = asyncio.create_task(bybit.connect())
-        await asyncio.sleep(2)  # Wait for connection and first update
-        bybit_task.cancel()
-        
-        price_data = collector.get_exchange(settings.cex_symbol, "bybit")
-        if price_data:
-            logger.info(f"  {settings.cex_symbol}:  Bid={price_data.bid:.8f}  Ask={price_data.ask:.8f}  Spread={price_data.spread:.8f}")
-        else:
-            logger.warning("  No price data")
-    except asyncio.CancelledError:
-        logger.info("  Bybit fetch complete")
-    except Exception as e:
-        logger.error(f"  Bybit error: {e}")
-    
-    # MEXC
-    try:
-        logger.info("\n📊 MEXC")
-        mexc = MexcWS(collector=collector, symbols=[settings.cex_symbol])
-        mexc_task = asyncio.create_task(mexc.connect())
-        await asyncio.sleep(2)  # Wait for first poll
-        mexc_task.cancel()
-        
-        price_data = collector.get_exchange(settings.cex_symbol, "mexc")
+    feeds = {
+        "Bybit": BybitWS(collector=collector, symbols=[settings.cex_symbol]),
+        "MEXC": MexcWS(collector=collector, symbols=[settings.cex_symbol]),
+    }
+
+    # Run both feeds side by side and let them collect one update
+    tasks = [asyncio.create_task(feed.connect()) for feed in feeds.values()]
+    await asyncio.sleep(2)  # Wait for connection / first poll
+    for t in tasks:
+        t.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for name, result in zip(feeds, results):
+        logger.info(f"\n📊 {name.upper()}")
+        if isinstance(result, Exception):
+            logger.error(f"  {name} error: {result}")
+            continue
+
+        price_data = collector.get_exchange(settings.cex_symbol, name.lower())
         if price_data:
             logger.info(f"  {settings.cex_symbol}:  Bid={price_data.bid:.8f}  Ask={price_data.ask:.8f}  Spread={price_data.spread:.8f}")
         else:
             logger.warning("  No price data")
-    except asyncio.CancelledError:
-        logger.info("  MEXC fetch complete")
-    except Exception as e:
-        logger.error(f"  MEXC error: {e}")
     
     logger.info("\n" + "=" * 80)
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(log_prices())
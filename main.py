@@ -16,8 +16,20 @@ from exchanges.mexc import MexcWS
 from utils.logger import get_logger
 from utils.telegram_notifier import notifier as tg_notifier
 
+try:
+    import uvloop  # optional: faster event loop for the socket-heavy feeds
+except ImportError:
+    uvloop = None
+
 logger = get_logger()
 
+SHUTDOWN_TIMEOUT_S = 5.0
+
+
+def _mask(key: str, keep: int = 6) -> str:
+    """Show the first *keep* characters of a secret, star out the rest."""
+    return key[:keep] + "*" * (len(key) - keep)
+
 
 def validate_accounts() -> Tuple[bool, bool]:
     """Check which exchange accounts are configured and log results.
@@ -37,8 +49,7 @@ def validate_accounts() -> Tuple[bool, bool]:
         )
     else:
         enable_bybit = True
-        masked = settings.bybit_api_key[:6] + "*" * (len(settings.bybit_api_key) - 6)
-        logger.success(f"[Bybit]        ✓  api_key={masked}  (arb ENABLED)")
+        logger.success(f"[Bybit]        ✓  api_key={_mask(settings.bybit_api_key)}  (arb ENABLED)")
 
     # ── MEXC ──────────────────────────────────────────────────────────
     enable_mexc = False
@@ -49,8 +60,7 @@ def validate_accounts() -> Tuple[bool, bool]:
         )
     else:
         enable_mexc = True
-        masked = settings.mexc_api_key[:6] + "*" * (len(settings.mexc_api_key) - 6)
-        logger.success(f"[MEXC]         ✓  api_key={masked}  (arb ENABLED)")
+        logger.success(f"[MEXC]         ✓  api_key={_mask(settings.mexc_api_key)}  (arb ENABLED)")
 
     # ── Summary ───────────────────────────────────────────────────────
     enabled = []
@@ -148,16 +158,19 @@ async def main() -> None:
 
     # --- Graceful shutdown ---
     shutdown_event = asyncio.Event()
+    tasks: list[asyncio.Task] = []
 
     def _signal_handler() -> None:
         logger.info("Shutdown signal received — stopping…")
         shutdown_event.set()
+        # Cancel right here so in-flight HTTP/WS awaits abort immediately
+        for t in tasks:
+            t.cancel()
 
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, _signal_handler)
 
     # --- Launch all tasks ---
-    tasks = []
     if bybit:
         tasks.append(asyncio.create_task(bybit.connect(), name="bybit"))
     if mexc:
@@ -189,6 +202,7 @@ async def main() -> None:
         tasks.append(asyncio.create_task(tg_notifier.run_listener(shutdown_event, context), name="telegram_listener"))
 
     # --- Rebalance Manager (CEX -> DEX refill) ---
+    rebalancer = None
     if settings.rebalance_enabled:
         rebalancer = RebalanceManager(
             balance_manager=balance_manager,
@@ -209,13 +223,27 @@ async def main() -> None:
     # Wait until shutdown is requested
     await shutdown_event.wait()
 
-    # Cancel all tasks gracefully
+    # Cancel all tasks; don't let one that is slow to unwind hold up exit
     for t in tasks:
         t.cancel()
-    await asyncio.gather(*tasks, return_exceptions=True)
+    _, pending = await asyncio.wait(tasks, timeout=SHUTDOWN_TIMEOUT_S)
+    if pending:
+        logger.warning(
+            f"{len(pending)} task(s) still running after {SHUTDOWN_TIMEOUT_S:.0f}s: "
+            f"{', '.join(t.get_name() for t in pending)}"
+        )
+
+    # Stop components that own background tasks / HTTP sessions of their own
+    await gas_monitor.stop()
+    if rebalancer:
+        await rebalancer.stop()
+    await balance_manager.close()
+    await trade_executor.close()
 
     logger.info("Arb bot shut down cleanly.")
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -434,10 +434,19 @@ class IntegratedArbMonitor:
             logger.error(f"Monitor error: {e}")
             raise
 
+    async def close(self) -> None:
+        """Close the traders' HTTP sessions, including the executor's own."""
+        await self._bybit_trader.close()
+        await self._mexc_trader.close()
+        await self.trade_executor.close()
+
 
 async def main():
     monitor = IntegratedArbMonitor()
-    await monitor.run()
+    try:
+        await monitor.run()
+    finally:
+        await monitor.close()
 
 
 if __name__ == "__main__":
@@ -14,19 +14,39 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
 import csv
+import functools
 import hashlib
 import hmac
 import os
+import random
+import re
+import sys
 import time
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import aiohttp
 from dotenv import load_dotenv
 
+try:
+    import ijson  # optional: stream-parse large /resources responses
+except ImportError:
+    ijson = None
+
+try:
+    import orjson  # optional: faster JSON decoding
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop  # optional: faster event loop for the HTTP fan-out
+except ImportError:
+    uvloop = None
+
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -36,10 +56,66 @@ APTOS_NODE  = os.getenv("APTOS_NODE_URL", "https://fullnode.mainnet.aptoslabs.co
 AMI_ADDR    = os.getenv("AMI_TOKEN_ADDRESS",  "0xb36527754eb54d7ff55daf13bcb54b42b88ec484bd6f0e3b2e0d1db169de6451")
 USDT_ADDR   = os.getenv("USDT_TOKEN_ADDRESS", "0x357b0b74bc833e95a115ad22604854d6b0fca151cecd94111770e5d6ffc9dc2b")
 
+ROW_WORKERS    = 8    # accounts checked concurrently
+ROW_QUEUE_SIZE = 64   # CSV rows read ahead of the workers
+
+# Classifies a resource type as the AMI or USDT CoinStore in one match;
+# the inner coin type is captured in the "AMI" / "USDT" named group.
+COINSTORE_RE = re.compile(
+    rf"0x1::coin::CoinStore<(?:(?P<AMI>{re.escape(AMI_ADDR)}::.*)"
+    rf"|(?P<USDT>{re.escape(USDT_ADDR)}::.*))>"
+)
+
+HTTP_ATTEMPTS       = 3
+HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+#  HTTP
+# ─────────────────────────────────────────────────────────────────────────────
+@contextlib.asynccontextmanager
+async def _http_get(
+    session: aiohttp.ClientSession,
+    url: str,
+    **kwargs,
+) -> AsyncIterator[aiohttp.ClientResponse]:
+    """``session.get`` that retries transient failures.
+
+    Connection errors, timeouts and 429/5xx responses are retried up to
+    HTTP_ATTEMPTS times with jittered exponential backoff (0.1 s – 1 s).
+    Anything else — including the last failed attempt — goes to the caller.
+    """
+    for attempt in range(1, HTTP_ATTEMPTS + 1):
+        try:
+            resp = await session.get(url, **kwargs)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if attempt == HTTP_ATTEMPTS:
+                raise
+        else:
+            if resp.status not in HTTP_RETRY_STATUSES or attempt == HTTP_ATTEMPTS:
+                try:
+                    yield resp
+                finally:
+                    resp.release()
+                return
+            resp.release()
+        await asyncio.sleep(max(0.1, random.uniform(0, min(1.0, 0.1 * 2 ** attempt))))
+
+
+async def _json(resp: aiohttp.ClientResponse):
+    """Decode a response body, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(await resp.read())
+    return await resp.json()
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Result models
 # ─────────────────────────────────────────────────────────────────────────────
+def _mask(key: str, keep: int = 12) -> str:
+    return f"{key[:keep]}..."
+
+
 @dataclass
 class BybitProfile:
     index: int
@@ -52,6 +128,10 @@ class BybitProfile:
     vip_level: str = ""
     balances: str = ""   # only when --show-balances
     note: str = ""
+    masked_key: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.masked_key = _mask(self.api_key)
 
 
 @dataclass
@@ -67,6 +147,10 @@ class MexcProfile:
     taker_commission: str = ""
     balances: str = ""    # "USDT:10.00, AMI:500.00" (only if --show-balances)
     note: str = ""
+    masked_key: str = field(init=False, default="")
+
+    def __post_init__(self) -> None:
+        self.masked_key = _mask(self.api_key)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -82,22 +166,41 @@ class AptosProfile:
     note: str = ""
 
 
+# coin_type → decimals; every account holds the same two coins, so this is
+# filled by the first account and reused by the rest.
+_DECIMALS_CACHE: dict[str, int] = {}
+
+
 async def _aptos_get_decimals(
     session: aiohttp.ClientSession,
     coin_type: str,
 ) -> int:
-    """Fetch decimal places from CoinInfo resource."""
+    """Fetch decimal places from CoinInfo resource (cached per coin type)."""
+    if coin_type in _DECIMALS_CACHE:
+        return _DECIMALS_CACHE[coin_type]
     # CoinInfo is stored at the coin's defining module address
     module_addr = coin_type.split("::")[0]
     url = f"{APTOS_NODE}/accounts/{module_addr}/resource/0x1::coin::CoinInfo%3C{coin_type}%3E"
     try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=8)) as r:
+        async with _http_get(session, url, timeout=aiohttp.ClientTimeout(total=8)) as r:
             if r.status == 200:
-                data = await r.json()
-                return int(data.get("data", {}).get("decimals", 8))
+                data = await _json(r)
+                dec = int(data.get("data", {}).get("decimals", 8))
+                _DECIMALS_CACHE[coin_type] = dec
+                return dec
     except Exception:
         pass
-    return 8  # safe default
+    return 8  # safe default (not cached, so a later account can retry)
+
+
+def _take_coin_store(res: dict, found: dict[str, tuple[str, int]]) -> bool:
+    """Record *res* in *found* if it is a tracked CoinStore; True once both are in."""
+    m = COINSTORE_RE.fullmatch(res.get("type", ""))
+    if m is None:
+        return False
+    key = m.lastgroup
+    found[key] = (m.group(key), int(res.get("data", {}).get("coin", {}).get("value", 0)))
+    return len(found) == 2
 
 
 async def check_aptos(
@@ -110,7 +213,9 @@ async def check_aptos(
 
     try:
         url = f"{APTOS_NODE}/accounts/{address}/resources"
-        async with session.get(
+        found: dict[str, tuple[str, int]] = {}
+        async with _http_get(
+            session,
             url,
             params={"limit": "9999"},
             timeout=aiohttp.ClientTimeout(total=10),
@@ -122,32 +227,30 @@ async def check_aptos(
             if resp.status != 200:
                 return AptosProfile(index, address, "ERROR",
                                     note=f"HTTP {resp.status}")
-            resources = await resp.json()
+            if ijson is not None:
+                # Consume the array item by item and stop reading the body
+                # as soon as both CoinStores have been seen.
+                async for res in ijson.items_async(resp.content, "item"):
+                    if _take_coin_store(res, found):
+                        break
+            else:
+                for res in await _json(resp):
+                    if _take_coin_store(res, found):
+                        break
 
         ami_balance = usdt_balance = "0"
-        ami_coin_type = usdt_coin_type = ""
-
-        for res in resources:
-            rtype: str = res.get("type", "")
-            if not rtype.startswith("0x1::coin::CoinStore<"):
-                continue
-            # Extract the inner coin type
-            inner = rtype[len("0x1::coin::CoinStore<"):-1]
-            raw_val = int(res.get("data", {}).get("coin", {}).get("value", 0))
-            if inner.startswith(AMI_ADDR):
-                ami_coin_type = inner
-                ami_raw = raw_val
-            elif inner.startswith(USDT_ADDR):
-                usdt_coin_type = inner
-                usdt_raw = raw_val
-
-        # Resolve decimals + format
+        ami_coin_type, ami_raw = found.get("AMI", ("", 0))
+        usdt_coin_type, usdt_raw = found.get("USDT", ("", 0))
+
+        # Resolve decimals (both lookups in parallel) + format
+        ami_dec, usdt_dec = await asyncio.gather(
+            _aptos_get_decimals(session, ami_coin_type) if ami_coin_type else asyncio.sleep(0),
+            _aptos_get_decimals(session, usdt_coin_type) if usdt_coin_type else asyncio.sleep(0),
+        )
         if ami_coin_type:
-            dec = await _aptos_get_decimals(session, ami_coin_type)
-            ami_balance = f"{ami_raw / 10**dec:.{dec}f}"
+            ami_balance = f"{ami_raw / 10**ami_dec:.{ami_dec}f}"
         if usdt_coin_type:
-            dec = await _aptos_get_decimals(session, usdt_coin_type)
-            usdt_balance = f"{usdt_raw / 10**dec:.{dec}f}"
+            usdt_balance = f"{usdt_raw / 10**usdt_dec:.{usdt_dec}f}"
 
         return AptosProfile(
             index, address, "OK",
@@ -159,65 +262,163 @@ async def check_aptos(
         return AptosProfile(index, address, "ERROR", note=str(e))
 
 
-def print_aptos(p: AptosProfile) -> None:
+def format_aptos(p: AptosProfile) -> str:
     icon = _status_icon(p.status)
+    out: list[str] = []
     addr = p.address
     short = f"{addr[:20]}...{addr[-8:]}" if len(addr) > 30 else addr
-    print(f"  {icon} Aptos  [{p.index}] {short}")
+    out.append(f"  {icon} Aptos  [{p.index}] {short}")
     if p.status == "OK":
-        print(f"       full : {addr}")
-        print(f"       AMI  : {p.ami_balance}")
-        print(f"       USDT : {p.usdt_balance}")
+        out.append(f"       full : {addr}")
+        out.append(f"       AMI  : {p.ami_balance}")
+        out.append(f"       USDT : {p.usdt_balance}")
     elif p.status in ("ERROR", "SKIPPED"):
-        print(f"       note: {p.note}")
+        out.append(f"       note: {p.note}")
+    return "\n".join(out) + "\n"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Bybit
 # ─────────────────────────────────────────────────────────────────────────────
-def _bybit_sign(api_key: str, secret: str, timestamp: str,
-                recv_window: str, body: str = "") -> str:
-    message = timestamp + api_key + recv_window + body
-    return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
-
-
-def _bybit_headers(api_key: str, api_secret: str,
-                   recv_window: str = "5000",
-                   qs: str = "") -> tuple[dict, str]:
-    """Return signed headers + fresh timestamp."""
-    ts  = str(int(time.time() * 1000))
-    sig = _bybit_sign(api_key, api_secret, ts, recv_window, qs)
+@dataclass
+class _BybitCreds:
+    """Per-account signing state, encoded once and reused for every request."""
+    api_key: str
+    recv_window: str
+    api_key_b: bytes
+    recv_window_b: bytes
+    signer: hmac.HMAC     # pre-keyed HMAC-SHA256; ``.copy()`` it per request
+
+
+@functools.lru_cache(maxsize=256)
+def _bybit_creds(api_key: str, api_secret: str,
+                 recv_window: str = "5000") -> _BybitCreds:
+    return _BybitCreds(
+        api_key=api_key,
+        recv_window=recv_window,
+        api_key_b=api_key.encode(),
+        recv_window_b=recv_window.encode(),
+        signer=hmac.new(api_secret.encode(), digestmod=hashlib.sha256),
+    )
+
+
+def _bybit_ts() -> str:
+    return str(time.time_ns() // 1_000_000)
+
+
+def _bybit_sign(creds: _BybitCreds, timestamp: str, body: str = "") -> str:
+    # Feed the pieces straight into the MAC instead of concatenating first.
+    h = creds.signer.copy()
+    h.update(timestamp.encode())
+    h.update(creds.api_key_b)
+    h.update(creds.recv_window_b)
+    if body:
+        h.update(body.encode())
+    return h.hexdigest()
+
+
+def _bybit_headers(creds: _BybitCreds,
+                   qs: str = "",
+                   ts: Optional[str] = None) -> tuple[dict, str]:
+    """Return signed headers + timestamp (fresh unless *ts* is given)."""
+    ts  = ts or _bybit_ts()
+    sig = _bybit_sign(creds, ts, qs)
     return {
-        "X-BAPI-API-KEY":     api_key,
+        "X-BAPI-API-KEY":     creds.api_key,
         "X-BAPI-SIGN":        sig,
         "X-BAPI-SIGN-TYPE":   "2",
         "X-BAPI-TIMESTAMP":   ts,
-        "X-BAPI-RECV-WINDOW": recv_window,
+        "X-BAPI-RECV-WINDOW": creds.recv_window,
     }, ts
 
 
+async def _bybit_get(
+    session: aiohttp.ClientSession,
+    path: str,
+    headers: dict,
+    params: Optional[dict] = None,
+) -> dict:
+    async with _http_get(
+        session,
+        f"{BYBIT_BASE}{path}",
+        headers=headers,
+        params=params,
+        timeout=aiohttp.ClientTimeout(total=10),
+    ) as resp:
+        return await _json(resp)
+
+
+async def _bybit_spot_balances(
+    session: aiohttp.ClientSession,
+    creds: _BybitCreds,
+) -> tuple[str, bool]:
+    """Spot wallet balance for AMI + USDT, formatted as "AMI:x | USDT:y".
+
+    The flag is False when Bybit rejected the request (retCode ≠ 0, e.g. a
+    key without wallet-read permission); the balances then read as zero.
+    """
+    coin_qs = "accountType=SPOT&coin=AMI,USDT"
+    hdrs, _ = _bybit_headers(creds, coin_qs)
+    bal_data = await _bybit_get(
+        session, "/v5/account/wallet-balance", hdrs,
+        params={"accountType": "SPOT", "coin": "AMI,USDT"},
+    )
+    ok = bal_data.get("retCode") == 0
+    coins = (
+        bal_data.get("result", {}).get("list", [{}])[0].get("coin", [])
+        if ok else []
+    )
+    coin_map = {c["coin"]: c.get("walletBalance", "0") for c in coins}
+    ami_bal  = coin_map.get("AMI",  "0")
+    usdt_bal = coin_map.get("USDT", "0")
+    return f"AMI:{ami_bal} | USDT:{usdt_bal}", ok
+
+
+def _drop_failed_balance(
+    balance_cache: dict[str, asyncio.Future],
+    uid: str,
+    fut: asyncio.Future,
+) -> None:
+    """Done-callback: forget *fut* for *uid* unless it fetched balances."""
+    if not fut.cancelled() and fut.exception() is None and fut.result()[1]:
+        return
+    if balance_cache.get(uid) is fut:
+        del balance_cache[uid]
+
+
 async def check_bybit(
     session: aiohttp.ClientSession,
     index: int,
     api_key: str,
     api_secret: str,
     show_balances: bool = False,
+    balance_cache: Optional[dict[str, asyncio.Future]] = None,
 ) -> BybitProfile:
+    """Check one Bybit key.
+
+    *balance_cache* maps UID → pending/finished balance fetch and is shared
+    across rows by ``run()``, so several keys on the same Bybit account
+    cost a single wallet-balance request.  A fetch that raises or is
+    rejected drops out of the cache, so the next key on that UID tries its
+    own.
+    """
     if not api_key or not api_secret:
         return BybitProfile(index, api_key or "(empty)", "SKIPPED",
                             note="No API key in CSV")
 
-    recv_window = "5000"
+    # Creds are cached per key, so rows repeating a key reuse the keyed MAC.
+    # Both GETs below have an empty query string and are issued together,
+    # so they share one timestamp and therefore one signature.
+    creds   = _bybit_creds(api_key, api_secret)
+    hdrs, _ = _bybit_headers(creds)
 
     try:
-        # 1. API key info
-        hdrs, _ = _bybit_headers(api_key, api_secret, recv_window)
-        async with session.get(
-            f"{BYBIT_BASE}/v5/user/query-api",
-            headers=hdrs,
-            timeout=aiohttp.ClientTimeout(total=10),
-        ) as resp:
-            data = await resp.json()
+        data, acc_data = await asyncio.gather(
+            # 1. API key info
+            _bybit_get(session, "/v5/user/query-api", hdrs),
+            # 2. Account info (VIP level)
+            _bybit_get(session, "/v5/account/info", hdrs),
+        )
 
         ret = data.get("retCode")
         if ret != 0:
@@ -227,51 +428,36 @@ async def check_bybit(
             )
 
         result   = data.get("result", {})
+        uid      = str(result.get("userID", ""))
         perms    = result.get("permissions", {})
         perm_str = ", ".join(f"{k}:{v}" for k, v in perms.items() if v)
         ips      = result.get("ips", [])
         ip_str   = ", ".join(ips) if ips else "unrestricted"
 
-        # 2. Account info (VIP level)
-        hdrs2, _ = _bybit_headers(api_key, api_secret, recv_window)
-        async with session.get(
-            f"{BYBIT_BASE}/v5/account/info",
-            headers=hdrs2,
-            timeout=aiohttp.ClientTimeout(total=10),
-        ) as resp2:
-            acc_data = await resp2.json()
-
         acc_result   = acc_data.get("result", {})
         vip_level    = str(acc_result.get("vipLevel", ""))
         account_type = str(acc_result.get("unifiedMarginStatus", ""))
 
         balance_str = ""
         if show_balances:
-            # 3. Spot wallet balance for AMI + USDT
-            coin_qs = "accountType=SPOT&coin=AMI,USDT"
-            hdrs3, ts3 = _bybit_headers(api_key, api_secret, recv_window, coin_qs)
-            async with session.get(
-                f"{BYBIT_BASE}/v5/account/wallet-balance",
-                headers=hdrs3,
-                params={"accountType": "SPOT", "coin": "AMI,USDT"},
-                timeout=aiohttp.ClientTimeout(total=10),
-            ) as resp3:
-                bal_data = await resp3.json()
-
-            coins = (
-                bal_data.get("result", {}).get("list", [{}])[0].get("coin", [])
-                if bal_data.get("retCode") == 0 else []
-            )
-            coin_map = {c["coin"]: c.get("walletBalance", "0") for c in coins}
-            ami_bal  = coin_map.get("AMI",  "0")
-            usdt_bal = coin_map.get("USDT", "0")
-            balance_str = f"AMI:{ami_bal} | USDT:{usdt_bal}"
+            # 3. Spot wallet balance — once per UID
+            fut = balance_cache.get(uid) if balance_cache is not None and uid else None
+            if fut is None:
+                fut = asyncio.ensure_future(
+                    _bybit_spot_balances(session, creds)
+                )
+                if balance_cache is not None and uid:
+                    balance_cache[uid] = fut
+                    fut.add_done_callback(
+                        lambda f, uid=uid: _drop_failed_balance(balance_cache, uid, f)
+                    )
+            balance_str, _ = await fut
 
         return BybitProfile(
             index,
             api_key=api_key,
             status="OK",
-            uid=str(result.get("userID", "")),
+            uid=uid,
             account_type=account_type,
             permissions=perm_str,
             ip_bound=ip_str,
@@ -286,31 +472,35 @@ async def check_bybit(
 # ─────────────────────────────────────────────────────────────────────────────
 #  MEXC
 # ─────────────────────────────────────────────────────────────────────────────
-def _mexc_sign(secret: str, query_string: str) -> str:
-    return hmac.new(secret.encode(), query_string.encode(), hashlib.sha256).hexdigest()
+def _mexc_sign(secret_b: bytes, query_string: str) -> str:
+    return hmac.new(secret_b, query_string.encode(), hashlib.sha256).hexdigest()
 
 
 async def _mexc_get(
     session: aiohttp.ClientSession,
     api_key: str,
-    api_secret: str,
+    secret_b: bytes,
     path: str,
     extra_params: Optional[dict] = None,
 ) -> dict:
-    params: dict = {"timestamp": str(int(time.time() * 1000))}
-    if extra_params:
-        params.update(extra_params)
-    qs  = urllib.parse.urlencode(params)
-    sig = _mexc_sign(api_secret, qs)
-    params["signature"] = sig
+    ts = str(time.time_ns() // 1_000_000)
+    if extra_params is None:
+        # Timestamp is all digits — no escaping needed, skip urlencode.
+        qs = "timestamp=" + ts
+        params: dict = {"timestamp": ts, "signature": _mexc_sign(secret_b, qs)}
+    else:
+        params = {"timestamp": ts, **extra_params}
+        qs  = urllib.parse.urlencode(params)
+        params["signature"] = _mexc_sign(secret_b, qs)
     headers = {"X-MEXC-APIKEY": api_key}
-    async with session.get(
+    async with _http_get(
+        session,
         f"{MEXC_BASE}{path}",
         headers=headers,
         params=params,
         timeout=aiohttp.ClientTimeout(total=10),
     ) as resp:
-        return await resp.json()
+        return await _json(resp)
 
 
 async def check_mexc(
@@ -326,7 +516,7 @@ async def check_mexc(
 
     try:
         # Account info + permissions
-        data = await _mexc_get(session, api_key, api_secret, "/api/v3/account")
+        data = await _mexc_get(session, api_key, api_secret.encode(), "/api/v3/account")
 
         if "code" in data and data["code"] != 0:
             return MexcProfile(
@@ -375,58 +565,68 @@ def _status_icon(status: str) -> str:
     return {"OK": "✅", "ERROR": "❌", "SKIPPED": "⏭️"}.get(status, "?")
 
 
-def print_bybit(p: BybitProfile) -> None:
+def format_bybit(p: BybitProfile) -> str:
     icon = _status_icon(p.status)
-    print(f"  {icon} Bybit  [{p.index}] key={p.api_key[:12]}...")
+    out: list[str] = []
+    out.append(f"  {icon} Bybit  [{p.index}] key={p.masked_key}")
     if p.status == "OK":
-        print(f"       UID={p.uid}  vip={p.vip_level}  account_type={p.account_type}")
-        print(f"       permissions: {p.permissions}")
-        print(f"       IP bound:    {p.ip_bound}")
+        out.append(f"       UID={p.uid}  vip={p.vip_level}  account_type={p.account_type}")
+        out.append(f"       permissions: {p.permissions}")
+        out.append(f"       IP bound:    {p.ip_bound}")
         if p.balances:
             # parse "AMI:x | USDT:y" into two lines
             parts = {k.strip(): v.strip() for part in p.balances.split("|") for k, v in [part.split(":", 1)]}
-            print(f"       AMI  : {parts.get('AMI', '0')}")
-            print(f"       USDT : {parts.get('USDT', '0')}")
+            out.append(f"       AMI  : {parts.get('AMI', '0')}")
+            out.append(f"       USDT : {parts.get('USDT', '0')}")
     elif p.status in ("ERROR", "SKIPPED"):
-        print(f"       note: {p.note}")
+        out.append(f"       note: {p.note}")
+    return "\n".join(out) + "\n"
 
 
-def print_mexc(p: MexcProfile) -> None:
+def format_mexc(p: MexcProfile) -> str:
     icon = _status_icon(p.status)
-    print(f"  {icon} MEXC   [{p.index}] key={p.api_key[:12]}...")
+    out: list[str] = []
+    out.append(f"  {icon} MEXC   [{p.index}] key={p.masked_key}")
     if p.status == "OK":
-        print(
+        out.append(
             f"       type={p.account_type}  "
             f"canTrade={p.can_trade}  canWithdraw={p.can_withdraw}  canDeposit={p.can_deposit}"
         )
-        print(f"       fees: maker={p.maker_commission} taker={p.taker_commission}")
+        out.append(f"       fees: maker={p.maker_commission} taker={p.taker_commission}")
         if p.balances:
-            print(f"       balances: {p.balances}")
+            out.append(f"       balances: {p.balances}")
     elif p.status in ("ERROR", "SKIPPED"):
-        print(f"       note: {p.note}")
+        out.append(f"       note: {p.note}")
+    return "\n".join(out) + "\n"
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 #  Main
 # ─────────────────────────────────────────────────────────────────────────────
-def _load_wallets_csv(csv_path: Optional[str], label: str) -> list[dict]:
-    """Generic CSV loader → list of row dicts (index 0 = row 1)."""
+@functools.lru_cache(maxsize=32)
+def _read_csv_rows(path: Path, mtime: float) -> tuple[dict, ...]:
+    """Parse *path* once per (path, mtime) — an edited file is re-read."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return tuple(csv.DictReader(f))
+
+
+def _load_wallets_csv(csv_path: Optional[str], label: str) -> tuple[dict, ...]:
+    """Generic CSV loader → row dicts (index 0 = row 1)."""
     if not csv_path:
-        return []
+        return ()
     path = Path(csv_path)
     if not path.is_absolute():
         path = Path(__file__).parent.parent / path
     if not path.exists():
         print(f"⚠️  {label} wallets file not found: {path}")
-        return []
-    with open(path, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
+        return ()
+    rows = _read_csv_rows(path.resolve(), path.stat().st_mtime)
     print(f"ℹ️  Loaded {len(rows)} {label} wallet(s) from {path.name}")
     return rows
 
 
 def _resolve_keys(
-    wallet_rows: list[dict],
+    wallet_rows: tuple[dict, ...],
     idx: int,
     fallback_key: str,
     fallback_secret: str,
@@ -441,52 +641,120 @@ def _resolve_keys(
     return fallback_key, fallback_secret
 
 
+async def _check_row(
+    session: aiohttp.ClientSession,
+    row: dict,
+    bybit_rows: tuple[dict, ...],
+    mexc_rows: tuple[dict, ...],
+    show_balances: bool,
+    bybit_balances: dict[str, asyncio.Future],
+) -> tuple[int, AptosProfile, BybitProfile, MexcProfile]:
+    idx   = int(row.get("index", 0))
+    aptos = row.get("aptos_address", "")
+
+    b_key, b_secret = _resolve_keys(
+        bybit_rows, idx,
+        row.get("bybit_api_key", "").strip(),
+        row.get("bybit_api_secret", "").strip(),
+    )
+    m_key, m_secret = _resolve_keys(
+        mexc_rows, idx,
+        row.get("mexc_api_key", "").strip(),
+        row.get("mexc_api_secret", "").strip(),
+    )
+
+    aptos_result, bybit_result, mexc_result = await asyncio.gather(
+        check_aptos(session, idx, aptos),
+        check_bybit(session, idx, b_key, b_secret, show_balances,
+                    bybit_balances),
+        check_mexc(session, idx, m_key, m_secret, show_balances),
+    )
+    return idx, aptos_result, bybit_result, mexc_result
+
+
+def _print_row(
+    idx: int,
+    aptos_result: AptosProfile,
+    bybit_result: BybitProfile,
+    mexc_result: MexcProfile,
+) -> None:
+    # One write per account block instead of a print() per line
+    sys.stdout.write("".join((
+        f"─── Account #{idx} ───────────────────────────────────\n",
+        format_aptos(aptos_result),
+        format_bybit(bybit_result),
+        format_mexc(mexc_result),
+        "\n",
+    )))
+
+
+async def _print_in_order(q_out: asyncio.Queue) -> None:
+    """Print results in CSV order as they complete (None = end of stream)."""
+    pending: dict[int, tuple] = {}
+    next_seq = 1
+    while (item := await q_out.get()) is not None:
+        seq, result = item
+        pending[seq] = result
+        while next_seq in pending:
+            _print_row(*pending.pop(next_seq))
+            next_seq += 1
+
+
 async def run(
     csv_path: Path,
     show_balances: bool,
     bybit_wallets_path: Optional[str] = None,
     mexc_wallets_path: Optional[str] = None,
 ) -> None:
-    with open(csv_path, newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
-
-    if not rows:
-        print("CSV is empty.")
-        return
-
     bybit_rows = _load_wallets_csv(bybit_wallets_path, "Bybit")
     mexc_rows  = _load_wallets_csv(mexc_wallets_path,  "MEXC")
 
-    print(f"\n📋 Checking {len(rows)} account(s) from {csv_path.name}\n")
-
-    async with aiohttp.ClientSession() as session:
-        for row in rows:
-            idx   = int(row.get("index", 0))
-            aptos = row.get("aptos_address", "")
-
-            b_key, b_secret = _resolve_keys(
-                bybit_rows, idx,
-                row.get("bybit_api_key", "").strip(),
-                row.get("bybit_api_secret", "").strip(),
-            )
-            m_key, m_secret = _resolve_keys(
-                mexc_rows, idx,
-                row.get("mexc_api_key", "").strip(),
-                row.get("mexc_api_secret", "").strip(),
-            )
+    print(f"\n📋 Checking accounts from {csv_path.name}\n")
 
-            print(f"─── Account #{idx} ───────────────────────────────────")
+    bybit_balances: dict[str, asyncio.Future] = {}
+    # Rows are streamed from the CSV into a bounded queue and checked by
+    # ROW_WORKERS workers; results are re-ordered before printing.
+    q_in: asyncio.Queue = asyncio.Queue(maxsize=ROW_QUEUE_SIZE)
+    q_out: asyncio.Queue = asyncio.Queue()
 
-            aptos_result, bybit_result, mexc_result = await asyncio.gather(
-                check_aptos(session, idx, aptos),
-                check_bybit(session, idx, b_key, b_secret, show_balances),
-                check_mexc(session, idx, m_key, m_secret, show_balances),
-            )
+    # One pooled session for every account: keep-alive connections to the
+    # three hosts are reused across rows so TLS is negotiated once per host.
+    connector = aiohttp.TCPConnector(
+        limit=32,
+        keepalive_timeout=60,
+        ttl_dns_cache=300,
+    )
+    async with aiohttp.ClientSession(connector=connector) as session:
+
+        async def producer() -> int:
+            seq = 0
+            with open(csv_path, newline="", encoding="utf-8") as f:
+                for seq, row in enumerate(csv.DictReader(f), start=1):
+                    await q_in.put((seq, row))
+            for _ in range(ROW_WORKERS):
+                await q_in.put(None)
+            return seq
+
+        async def worker() -> None:
+            while (item := await q_in.get()) is not None:
+                seq, row = item
+                result = await _check_row(
+                    session, row, bybit_rows, mexc_rows,
+                    show_balances, bybit_balances,
+                )
+                await q_out.put((seq, result))
+
+        printer = asyncio.create_task(_print_in_order(q_out))
+        total, *_ = await asyncio.gather(
+            producer(), *(worker() for _ in range(ROW_WORKERS))
+        )
+        await q_out.put(None)
+        await printer
 
-            print_aptos(aptos_result)
-            print_bybit(bybit_result)
-            print_mexc(mexc_result)
-            print()
+    if total == 0:
+        print("CSV is empty.")
+    else:
+        print(f"✅ Checked {total} account(s)")
 
 
 def main() -> None:
@@ -519,6 +787,10 @@ def main() -> None:
         print(f"❌ File not found: {csv_path}")
         return
 
+    # Keep per-account blocks appearing as they finish, even when piped
+    sys.stdout.reconfigure(line_buffering=True)
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(run(csv_path, args.show_balances, args.bybit_wallets, args.mexc_wallets))
 
 
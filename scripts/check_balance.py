@@ -14,6 +14,11 @@ from exchanges.mexc_trader import MexcTrader
 from config.settings import settings
 from utils.logger import get_logger
 
+try:
+    import uvloop  # optional: faster event loop
+except ImportError:
+    uvloop = None
+
 logger = get_logger()
 
 # Constants
@@ -86,30 +91,28 @@ async def get_aptos_balances(address):
     
     return results
 
+async def _bybit_balances():
+    trader = BybitTrader()
+    try:
+        return await trader.get_balance()
+    finally:
+        await trader.close()
+
+async def _mexc_balances():
+    trader = MexcTrader()
+    try:
+        return await trader.get_balance()
+    finally:
+        await trader.close()
+
+async def _aptos_balances_or_none(address):
+    return await get_aptos_balances(address) if address else None
+
 async def main():
     print(f"\n{'='*50}")
     print(f"   UNIFIED BALANCE REPORT - {time.strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*50}\n")
 
-    # 1. Bybit
-    print("Checking Bybit...")
-    try:
-        bybit = BybitTrader()
-        bybit_bal = await bybit.get_balance()
-        print(f"Bybit Wallet: USDT={bybit_bal.get('USDT', 0):.2f}, AMI={bybit_bal.get('AMI', 0):.2f}, APT={bybit_bal.get('APT', 0):.2f}")
-    except Exception as e:
-        print(f"Bybit Error: {e}")
-
-    # 2. MEXC
-    print("\nChecking MEXC...")
-    try:
-        mexc = MexcTrader()
-        mexc_bal = await mexc.get_balance()
-        print(f"MEXC Wallet:  USDT={mexc_bal.get('USDT', 0):.2f}, AMI={mexc_bal.get('AMI', 0):.2f}, APT={mexc_bal.get('APT', 0):.2f}")
-    except Exception as e:
-        print(f"MEXC Error: {e}")
-
-    # 3. Aptos Wallet
     aptos_addr = settings.aptos_wallet_address
     if not aptos_addr and settings.aptos_private_key:
         try:
@@ -119,14 +122,39 @@ async def main():
         except ImportError:
             pass
 
-    if aptos_addr:
-        print(f"\nChecking Aptos Wallet ({aptos_addr}):")
-        aptos_bal = await get_aptos_balances(aptos_addr)
-        print(f"Aptos Wallet: APT={aptos_bal['APT']:.6f}, USDT={aptos_bal['USDT']:.2f}, AMI={aptos_bal['AMI']:.0f}")
+    # All three venues are independent — query them concurrently.
+    print("Checking Bybit, MEXC and Aptos...")
+    bybit_bal, mexc_bal, aptos_bal = await asyncio.gather(
+        _bybit_balances(),
+        _mexc_balances(),
+        _aptos_balances_or_none(aptos_addr),
+        return_exceptions=True,
+    )
+
+    # 1. Bybit
+    if isinstance(bybit_bal, Exception):
+        print(f"Bybit Error: {bybit_bal}")
     else:
+        print(f"Bybit Wallet: USDT={bybit_bal.get('USDT', 0):.2f}, AMI={bybit_bal.get('AMI', 0):.2f}, APT={bybit_bal.get('APT', 0):.2f}")
+
+    # 2. MEXC
+    if isinstance(mexc_bal, Exception):
+        print(f"\nMEXC Error: {mexc_bal}")
+    else:
+        print(f"\nMEXC Wallet:  USDT={mexc_bal.get('USDT', 0):.2f}, AMI={mexc_bal.get('AMI', 0):.2f}, APT={mexc_bal.get('APT', 0):.2f}")
+
+    # 3. Aptos Wallet
+    if not aptos_addr:
         print("\nChecking Aptos Wallet: No address found in .env")
+    elif isinstance(aptos_bal, Exception):
+        print(f"\nAptos Error ({aptos_addr}): {aptos_bal}")
+    else:
+        print(f"\nAptos Wallet ({aptos_addr}):")
+        print(f"Aptos Wallet: APT={aptos_bal['APT']:.6f}, USDT={aptos_bal['USDT']:.2f}, AMI={aptos_bal['AMI']:.0f}")
 
     print(f"\n{'='*50}")
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     asyncio.run(main())
@@ -9,8 +9,10 @@ from __future__ import annotations
 
 import argparse
 import csv
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
 from pathlib import Path
 
 from dotenv import load_dotenv
@@ -19,17 +21,19 @@ from aptos_sdk.account import Account as AptosAccount
 load_dotenv(Path(__file__).parent.parent / ".env")
 
 OUTPUT_DEFAULT = "aptos_wallets.csv"
+POOL_MIN_COUNT = 256  # below this, starting worker processes costs more than keygen
 
 
-@dataclass
+@dataclass(slots=True)
 class AptosRecord:
     index: int
     address: str = ""
     private_key: str = ""
     public_key: str = ""
-    created_at: str = field(
-        default_factory=lambda: datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    )
+    created_at: str = ""
+
+
+FIELDNAMES = [f.name for f in fields(AptosRecord)]
 
 
 def generate_wallet() -> tuple[str, str, str]:
@@ -38,25 +42,42 @@ def generate_wallet() -> tuple[str, str, str]:
     return str(acc.address()), acc.private_key.hex(), str(acc.public_key())
 
 
+def _generate(_: int) -> tuple[str, str, str]:
+    return generate_wallet()
+
+
+def iter_wallets(count: int):
+    """Yield *count* (address, private_key_hex, public_key_hex) tuples.
+
+    Large batches are spread over a process pool — keygen is CPU-bound.
+    """
+    if count < POOL_MIN_COUNT:
+        for _ in range(count):
+            yield generate_wallet()
+        return
+    chunksize = max(1, count // ((os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor() as ex:
+        yield from ex.map(_generate, range(count), chunksize=chunksize)
+
+
 def run(count: int, output: str) -> None:
     output_path = Path(__file__).parent.parent / output
 
-    records: list[AptosRecord] = []
-    for i in range(1, count + 1):
-        addr, priv, pub = generate_wallet()
-        rec = AptosRecord(index=i, address=addr, private_key=priv, public_key=pub)
-        records.append(rec)
-        print(f"  [{i}/{count}] {addr}")
-        print(f"           private_key: {priv}")
-
-    fieldnames = list(asdict(records[0]).keys())
+    # Write each wallet as soon as it exists — memory stays flat at any --count
+    saved = 0
+    # One batch, one timestamp — no clock read + format per wallet
+    created_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for rec in records:
-            writer.writerow(asdict(rec))
-
-    print(f"\n✅ Saved {len(records)} wallet(s) → {output_path}")
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+        for i, (addr, priv, pub) in enumerate(iter_wallets(count), 1):
+            r = AptosRecord(i, addr, priv, pub, created_at)
+            writer.writerow((r.index, r.address, r.private_key, r.public_key, r.created_at))
+            saved = i
+            print(f"  [{i}/{count}] {addr}")
+            print(f"           private_key: {priv}")
+
+    print(f"\n✅ Saved {saved} wallet(s) → {output_path}")
     print("⚠️  Keep this file safe — it contains private keys!\n")
 
 
@@ -15,6 +15,11 @@ from exchanges.bybit import BybitWS
 from exchanges.mexc import MexcWS
 from utils.logger import get_logger
 
+try:
+    import uvloop  # optional: faster event loop
+except ImportError:
+    uvloop = None
+
 logger = get_logger()
 
 
@@ -104,6 +109,8 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        uvloop.install()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
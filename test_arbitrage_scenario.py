@@ -11,168 +11,125 @@ from utils.logger import get_logger
 
 logger = get_logger()
 
+# Each scenario is one Bybit/MEXC order-book pair.  *direction* names the
+# leg expected to be profitable and picks which prices get reported;
+# *diff_fmt* overrides the default ".4f" used for the price difference.
+SCENARIOS = [
+    dict(
+        title="[SCENARIO 1] Buy Bybit (low ask) → Sell MEXC (high bid)",
+        direction="bybit_mexc",
+        bybit_bid=0.1199, bybit_ask=0.1200, bybit_bid_qty=50.0, bybit_ask_qty=100.0,
+        mexc_bid=0.1210, mexc_ask=0.1211, mexc_bid_qty=100.0, mexc_ask_qty=50.0,
+    ),
+    dict(
+        title="[SCENARIO 2] Buy MEXC (low ask) → Sell Bybit (high bid)",
+        direction="mexc_bybit",
+        bybit_bid=0.1220, bybit_ask=0.1221, bybit_bid_qty=150.0, bybit_ask_qty=50.0,
+        mexc_bid=0.1209, mexc_ask=0.1210, mexc_bid_qty=50.0, mexc_ask_qty=150.0,
+    ),
+    dict(
+        title="[SCENARIO 3] High profit opportunity",
+        direction="bybit_mexc",
+        bybit_bid=0.1149, bybit_ask=0.1150, bybit_bid_qty=50.0, bybit_ask_qty=200.0,
+        mexc_bid=0.1250, mexc_ask=0.1251, mexc_bid_qty=200.0, mexc_ask_qty=50.0,
+        diff_fmt=".2f",
+    ),
+    dict(
+        title="[SCENARIO 4] No arbitrage - prices too close (high spread)",
+        direction="bybit_mexc",
+        bybit_bid=0.1199, bybit_ask=0.1200, bybit_bid_qty=50.0, bybit_ask_qty=100.0,
+        mexc_bid=0.1201, mexc_ask=0.1202, mexc_bid_qty=100.0, mexc_ask_qty=50.0,
+        note="(This spread is usually consumed by fees - no profit)",
+    ),
+]
 
-async def test_arbitrage_scenario():
-    """Simulate realistic arbitrage scenarios."""
-    
-    collector = PriceCollector()
-    arb = ArbitrageEngine(collector, cex_symbol=settings.cex_symbol)
-    
+
+def run_scenario(collector: PriceCollector, arb: ArbitrageEngine, symbol: str, sc: dict):
+    """Load one scenario's order books and return the engine's CEX-CEX opportunity, if any."""
+    bybit = PriceData(sc["bybit_bid"], sc["bybit_ask"], sc["bybit_bid_qty"], sc["bybit_ask_qty"])
+    mexc = PriceData(sc["mexc_bid"], sc["mexc_ask"], sc["mexc_bid_qty"], sc["mexc_ask_qty"])
+    collector.load_snapshot({symbol: {"bybit": bybit, "mexc": mexc}})
+    return arb._check_cex_cex(bybit, mexc)
+
+
+async def compute_scenarios(collector: PriceCollector, arb: ArbitrageEngine, symbol: str) -> list:
+    """Feed every scenario through the engine; return (scenario, opportunity) pairs."""
+    return [(sc, run_scenario(collector, arb, symbol, sc)) for sc in SCENARIOS]
+
+
+def render(results: list, symbol: str, bybit_fee: float, mexc_fee: float, min_profit: float) -> None:
+    """Print the scenario report."""
     print("\n" + "="*80)
     print("ARBITRAGE TEST SCENARIO")
     print("="*80)
-    print(f"Symbol: {settings.cex_symbol}")
-    print(f"Bybit fee: {settings.bybit_fee*100:.2f}%")
-    print(f"MEXC fee: {settings.mexc_fee*100:.2f}%")
-    print(f"Min profit threshold: ${settings.min_profit_threshold:.4f}")
+    print(f"Symbol: {symbol}")
+    print(f"Bybit fee: {bybit_fee*100:.2f}%")
+    print(f"MEXC fee: {mexc_fee*100:.2f}%")
+    print(f"Min profit threshold: ${min_profit:.4f}")
     print("="*80 + "\n")
 
-    # =====================================================================
-    # SCENARIO 1: Classic arbitrage - Buy Bybit, Sell MEXC
-    # =====================================================================
-    print("\n[SCENARIO 1] Buy Bybit (low ask) → Sell MEXC (high bid)")
-    print("-" * 80)
-    
-    bybit_price = 0.1200  # Low ask price on Bybit
-    mexc_price = 0.1210   # High bid price on MEXC
-    quantity = 100.0
-    
-    collector.update("bybit", settings.cex_symbol, 
-                    bid=0.1199, ask=bybit_price, 
-                    bid_qty=50.0, ask_qty=quantity)
-    
-    collector.update("mexc", settings.cex_symbol,
-                    bid=mexc_price, ask=0.1211,
-                    bid_qty=quantity, ask_qty=50.0)
-    
-    print(f"Bybit: ask={bybit_price} (qty={quantity})")
-    print(f"MEXC:  bid={mexc_price} (qty={quantity})")
-    print(f"Price difference: {(mexc_price - bybit_price)*100:.4f}%")
-    
-    cex_prices = collector.get(settings.cex_symbol)
-    bybit = cex_prices.get("bybit")
-    mexc = cex_prices.get("mexc")
-    
-    if bybit and mexc:
-        arb._check_cex_cex(bybit, mexc)
-    
-    # =====================================================================
-    # SCENARIO 2: Reverse arbitrage - Buy MEXC, Sell Bybit
-    # =====================================================================
-    print("\n[SCENARIO 2] Buy MEXC (low ask) → Sell Bybit (high bid)")
-    print("-" * 80)
-    
-    bybit_bid = 0.1220   # High bid on Bybit
-    mexc_ask = 0.1210    # Low ask on MEXC
-    quantity = 150.0
-    
-    collector.update("bybit", settings.cex_symbol,
-                    bid=bybit_bid, ask=0.1221,
-                    bid_qty=quantity, ask_qty=50.0)
-    
-    collector.update("mexc", settings.cex_symbol,
-                    bid=0.1209, ask=mexc_ask,
-                    bid_qty=50.0, ask_qty=quantity)
-    
-    print(f"Bybit: bid={bybit_bid} (qty={quantity})")
-    print(f"MEXC:  ask={mexc_ask} (qty={quantity})")
-    print(f"Price difference: {(bybit_bid - mexc_ask)*100:.4f}%")
-    
-    cex_prices = collector.get(settings.cex_symbol)
-    bybit = cex_prices.get("bybit")
-    mexc = cex_prices.get("mexc")
-    
-    if bybit and mexc:
-        arb._check_cex_cex(bybit, mexc)
-    
-    # =====================================================================
-    # SCENARIO 3: High profit arbitrage
-    # =====================================================================
-    print("\n[SCENARIO 3] High profit opportunity")
-    print("-" * 80)
-    
-    bybit_ask = 0.1150   # Very low ask
-    mexc_bid = 0.1250    # Very high bid
-    quantity = 200.0
-    
-    collector.update("bybit", settings.cex_symbol,
-                    bid=0.1149, ask=bybit_ask,
-                    bid_qty=50.0, ask_qty=quantity)
-    
-    collector.update("mexc", settings.cex_symbol,
-                    bid=mexc_bid, ask=0.1251,
-                    bid_qty=quantity, ask_qty=50.0)
-    
-    print(f"Bybit: ask={bybit_ask} (qty={quantity})")
-    print(f"MEXC:  bid={mexc_bid} (qty={quantity})")
-    print(f"Price difference: {(mexc_bid - bybit_ask)*100:.2f}%")
-    
-    cex_prices = collector.get(settings.cex_symbol)
-    bybit = cex_prices.get("bybit")
-    mexc = cex_prices.get("mexc")
-    
-    if bybit and mexc:
-        arb._check_cex_cex(bybit, mexc)
-    
-    # =====================================================================
-    # SCENARIO 4: No arbitrage - prices too close
-    # =====================================================================
-    print("\n[SCENARIO 4] No arbitrage - prices too close (high spread)")
-    print("-" * 80)
-    
-    bybit_ask_no_arb = 0.1200
-    mexc_bid_no_arb = 0.1201
-    quantity = 100.0
-    
-    collector.update("bybit", settings.cex_symbol,
-                    bid=0.1199, ask=bybit_ask_no_arb,
-                    bid_qty=50.0, ask_qty=quantity)
-    
-    collector.update("mexc", settings.cex_symbol,
-                    bid=mexc_bid_no_arb, ask=0.1202,
-                    bid_qty=quantity, ask_qty=50.0)
-    
-    print(f"Bybit: ask={bybit_ask_no_arb} (qty={quantity})")
-    print(f"MEXC:  bid={mexc_bid_no_arb} (qty={quantity})")
-    print(f"Price difference: {(mexc_bid_no_arb - bybit_ask_no_arb)*100:.4f}%")
-    print("(This spread is usually consumed by fees - no profit)")
-    
-    cex_prices = collector.get(settings.cex_symbol)
-    bybit = cex_prices.get("bybit")
-    mexc = cex_prices.get("mexc")
-    
-    if bybit and mexc:
-        arb._check_cex_cex(bybit, mexc)
-    
+    for sc, opp in results:
+        print("\n" + sc["title"])
+        print("-" * 80)
+        if sc["direction"] == "bybit_mexc":
+            print(f"Bybit: ask={sc['bybit_ask']} (qty={sc['bybit_ask_qty']})")
+            print(f"MEXC:  bid={sc['mexc_bid']} (qty={sc['mexc_bid_qty']})")
+            price_diff = sc["mexc_bid"] - sc["bybit_ask"]
+        else:
+            print(f"Bybit: bid={sc['bybit_bid']} (qty={sc['bybit_bid_qty']})")
+            print(f"MEXC:  ask={sc['mexc_ask']} (qty={sc['mexc_ask_qty']})")
+            price_diff = sc["bybit_bid"] - sc["mexc_ask"]
+        print(f"Price difference: {price_diff*100:{sc.get('diff_fmt', '.4f')}}%")
+        if "note" in sc:
+            print(sc["note"])
+        if opp is not None:
+            print(f"→ {opp.log_msg}")
+        else:
+            print("→ No opportunity")
+
     # =====================================================================
     # Manual Profit Calculation Example
     # =====================================================================
     print("\n[PROFIT CALCULATION] Manual example from Scenario 1")
     print("-" * 80)
-    
+
     buy_exchange = "Bybit"
     sell_exchange = "MEXC"
     buy_price = 0.1200
     sell_price = 0.1210
     qty = 100.0
-    bybit_fee_rate = settings.bybit_fee
-    mexc_fee_rate = settings.mexc_fee
-    
+
     buy_vol = qty * buy_price
     sell_vol = qty * sell_price
-    profit = sell_vol - buy_vol - (buy_vol * bybit_fee_rate) - (sell_vol * mexc_fee_rate)
-    
+    profit = sell_vol - buy_vol - (buy_vol * bybit_fee) - (sell_vol * mexc_fee)
+
     print(f"Buy {buy_exchange}  @ {buy_price} × {qty} = ${buy_vol:.2f}")
     print(f"Sell {sell_exchange} @ {sell_price} × {qty} = ${sell_vol:.2f}")
     print(f"Gross profit: ${sell_vol - buy_vol:.4f}")
-    print(f"Bybit fee (0.1%): ${buy_vol * bybit_fee_rate:.4f}")
-    print(f"MEXC fee (0.1%):  ${sell_vol * mexc_fee_rate:.4f}")
+    print(f"Bybit fee (0.1%): ${buy_vol * bybit_fee:.4f}")
+    print(f"MEXC fee (0.1%):  ${sell_vol * mexc_fee:.4f}")
     print(f"NET PROFIT: ${profit:.4f}")
-    
+
     print("\n" + "="*80)
     print("TEST COMPLETE")
     print("="*80 + "\n")
 
 
+async def test_arbitrage_scenario(verbose: bool = True) -> list:
+    """Simulate realistic arbitrage scenarios."""
+    symbol = settings.cex_symbol
+    bybit_fee = settings.bybit_fee
+    mexc_fee = settings.mexc_fee
+    min_profit = settings.min_profit_threshold
+
+    collector = PriceCollector()
+    arb = ArbitrageEngine(collector, cex_symbol=symbol)
+
+    results = await compute_scenarios(collector, arb, symbol)
+    if verbose:
+        render(results, symbol, bybit_fee, mexc_fee, min_profit)
+    return results
+
+
 if __name__ == "__main__":
     asyncio.run(test_arbitrage_scenario())
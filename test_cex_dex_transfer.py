@@ -91,69 +91,73 @@ async def main():
     # 1. Initialize
     bybit = BybitTrader()
     mexc = MexcTrader()
-    dex_helper = DexTransferHelper()
+    try:
+        dex_helper = DexTransferHelper()
     
-    # --- CONFIG ---
-    TEST_APT_AMOUNT = 0.5
-    TEST_AMI_AMOUNT = 100
+        # --- CONFIG ---
+        TEST_APT_AMOUNT = 0.5
+        TEST_AMI_AMOUNT = 100
     
-    # Get addresses from settings or env
-    DEX_WALLET = settings.aptos_address
+        # Get addresses from settings or env
+        DEX_WALLET = settings.aptos_address
     
-    BYBIT_DEPOSIT_ADDR = os.getenv("BYBIT_APT_DEPOSIT_ADDRESS", "")
-    MEXC_DEPOSIT_ADDR = os.getenv("MEXC_AMI_DEPOSIT_ADDRESS", "")
+        BYBIT_DEPOSIT_ADDR = os.getenv("BYBIT_APT_DEPOSIT_ADDRESS", "")
+        MEXC_DEPOSIT_ADDR = os.getenv("MEXC_AMI_DEPOSIT_ADDRESS", "")
     
-    print(f"\nSettings:")
-    print(f"- Dex Wallet: {DEX_WALLET}")
+        print(f"\nSettings:")
+        print(f"- Dex Wallet: {DEX_WALLET}")
     
-    menu = """
-    Choose action:
-    1. Withdraw APT (Bybit -> DEX)
-    2. Withdraw AMI (MEXC -> DEX)
-    3. Deposit APT (DEX -> Bybit) [Auto-fetch addr]
-    4. Deposit AMI (DEX -> MEXC) [Auto-fetch addr]
-    q. Quit
-    """
+        menu = """
+        Choose action:
+        1. Withdraw APT (Bybit -> DEX)
+        2. Withdraw AMI (MEXC -> DEX)
+        3. Deposit APT (DEX -> Bybit) [Auto-fetch addr]
+        4. Deposit AMI (DEX -> MEXC) [Auto-fetch addr]
+        q. Quit
+        """
     
-    while True:
-        print(menu)
-        choice = input("Enter choice: ").strip().lower()
+        while True:
+            print(menu)
+            choice = input("Enter choice: ").strip().lower()
         
-        if choice == '1':
-            print(f"Executing: Withdraw {TEST_APT_AMOUNT} APT from Bybit...")
-            # For Bybit V5, chain must often be "APT" for Aptos network
-            await bybit.withdraw("APT", TEST_APT_AMOUNT, DEX_WALLET, "APT")
+            if choice == '1':
+                print(f"Executing: Withdraw {TEST_APT_AMOUNT} APT from Bybit...")
+                # For Bybit V5, chain must often be "APT" for Aptos network
+                await bybit.withdraw("APT", TEST_APT_AMOUNT, DEX_WALLET, "APT")
         
-        elif choice == '2':
-            print(f"Executing: Withdraw {TEST_AMI_AMOUNT} AMI from MEXC...")
-            await mexc.withdraw("AMI", TEST_AMI_AMOUNT, DEX_WALLET, settings.mexc_withdraw_network)
+            elif choice == '2':
+                print(f"Executing: Withdraw {TEST_AMI_AMOUNT} AMI from MEXC...")
+                await mexc.withdraw("AMI", TEST_AMI_AMOUNT, DEX_WALLET, settings.mexc_withdraw_network)
             
-        elif choice == '3':
-            addr = BYBIT_DEPOSIT_ADDR
-            if not addr:
-                print("📡 Fetching Bybit deposit address via API...")
-                addr = await bybit.get_deposit_address("APT", settings.bybit_withdraw_chain)
+            elif choice == '3':
+                addr = BYBIT_DEPOSIT_ADDR
+                if not addr:
+                    print("📡 Fetching Bybit deposit address via API...")
+                    addr = await bybit.get_deposit_address("APT", settings.bybit_withdraw_chain)
             
-            if addr:
-                print(f"Executing: Deposit {TEST_APT_AMOUNT} APT to Bybit ({addr})...")
-                await dex_helper.transfer_apt(addr, TEST_APT_AMOUNT)
-            else:
-                print("❌ Failed to get Bybit deposit address.")
+                if addr:
+                    print(f"Executing: Deposit {TEST_APT_AMOUNT} APT to Bybit ({addr})...")
+                    await dex_helper.transfer_apt(addr, TEST_APT_AMOUNT)
+                else:
+                    print("❌ Failed to get Bybit deposit address.")
             
-        elif choice == '4':
-            addr = MEXC_DEPOSIT_ADDR
-            if not addr:
-                print("📡 Fetching MEXC deposit address via API...")
-                addr = await mexc.get_deposit_address("AMI", settings.mexc_withdraw_network)
+            elif choice == '4':
+                addr = MEXC_DEPOSIT_ADDR
+                if not addr:
+                    print("📡 Fetching MEXC deposit address via API...")
+                    addr = await mexc.get_deposit_address("AMI", settings.mexc_withdraw_network)
             
-            if addr:
-                print(f"Executing: Deposit {TEST_AMI_AMOUNT} AMI to MEXC ({addr})...")
-                await dex_helper.transfer_ami(addr, TEST_AMI_AMOUNT)
-            else:
-                print("❌ Failed to get MEXC deposit address.")
+                if addr:
+                    print(f"Executing: Deposit {TEST_AMI_AMOUNT} AMI to MEXC ({addr})...")
+                    await dex_helper.transfer_ami(addr, TEST_AMI_AMOUNT)
+                else:
+                    print("❌ Failed to get MEXC deposit address.")
             
-        elif choice == 'q':
-            break
+            elif choice == 'q':
+                break
+    finally:
+        await bybit.close()
+        await mexc.close()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -7,7 +7,17 @@ from core.price_collector import PriceCollector
 
 
 class TestArbitrageEngine(unittest.IsolatedAsyncioTestCase):
-    def _engine_with_zero_fees(self, collector: PriceCollector) -> ArbitrageEngine:
+    @classmethod
+    def setUpClass(cls):
+        cls.collector = PriceCollector()
+        # Read-only engine for tests that only feed it prices
+        cls.engine_zero = cls._engine_with_zero_fees(cls.collector)
+
+    def tearDown(self):
+        self.collector.clear()
+
+    @staticmethod
+    def _engine_with_zero_fees(collector: PriceCollector) -> ArbitrageEngine:
         engine = ArbitrageEngine(collector)
         engine.bybit_fee = 0.0
         engine.mexc_fee = 0.0
@@ -15,7 +25,7 @@ class TestArbitrageEngine(unittest.IsolatedAsyncioTestCase):
         return engine
 
     async def test_initialization(self):
-        collector = PriceCollector()
+        collector = self.collector
         engine = ArbitrageEngine(collector)
         
         # Verify required attributes are initialized
@@ -31,13 +41,15 @@ class TestArbitrageEngine(unittest.IsolatedAsyncioTestCase):
         self.assertIsInstance(engine._execution_lock, Lock)
 
     async def test_balance_aware_sizing(self):
-        collector = PriceCollector()
+        collector = self.collector
         # Price: 1 AMI = 0.0075 APT. 1 APT = 10 USDT.
         # So 1 AMI = 0.075 USDT.
-        collector.update("mexc", "AMIUSDT", bid=0.08, ask=0.08)
-        collector.update("mexc", "APTUSDT", bid=10.0, ask=10.0)
-        collector.update("bybit", "APTUSDT", bid=10.0, ask=10.0)
-        collector.update("bybit", "AMIUSDT", bid=0.08, ask=0.08)
+        collector.update_many([
+            ("mexc", "AMIUSDT", 0.08, 0.08, 0.0, 0.0),
+            ("mexc", "APTUSDT", 10.0, 10.0, 0.0, 0.0),
+            ("bybit", "APTUSDT", 10.0, 10.0, 0.0, 0.0),
+            ("bybit", "AMIUSDT", 0.08, 0.08, 0.0, 0.0),
+        ])
         
         engine = ArbitrageEngine(collector)
         engine.cellana_reserves_ami = 100000000 * 10**8 # Large reserves to make it profitable
@@ -69,24 +81,26 @@ class TestArbitrageEngine(unittest.IsolatedAsyncioTestCase):
         self.assertLessEqual(apt_leg.qty * 10, 10.0) # Size in USDT should be around 9.5 USDT
 
     async def test_check_cex_cex_logs_when_profitable(self):
-        collector = PriceCollector()
-        collector.update("bybit", "AMIUSDT", bid=99.0, ask=100.0, bid_qty=2.0, ask_qty=2.0)
-        collector.update("mexc", "AMIUSDT", bid=102.0, ask=101.0, bid_qty=3.0, ask_qty=3.0)
-        bybit = collector.get_exchange("AMIUSDT", "bybit")
-        mexc = collector.get_exchange("AMIUSDT", "mexc")
-        engine = self._engine_with_zero_fees(collector)
+        collector = self.collector
+        collector.update_many([
+            ("bybit", "AMIUSDT", 99.0, 100.0, 2.0, 2.0),
+            ("mexc", "AMIUSDT", 102.0, 101.0, 3.0, 3.0),
+        ])
+        bybit, mexc = collector.snapshot_cex("AMIUSDT")
+        engine = self.engine_zero
 
         opp = engine._check_cex_cex(bybit, mexc)
         self.assertIsNotNone(opp)
         self.assertGreater(opp.profit_usdt, 0)
 
     async def test_check_cex_cex_no_log_when_unprofitable(self):
-        collector = PriceCollector()
-        collector.update("bybit", "AMIUSDT", bid=101.0, ask=102.0, bid_qty=2.0, ask_qty=2.0)
-        collector.update("mexc", "AMIUSDT", bid=100.0, ask=101.0, bid_qty=3.0, ask_qty=3.0)
-        bybit = collector.get_exchange("AMIUSDT", "bybit")
-        mexc = collector.get_exchange("AMIUSDT", "mexc")
-        engine = self._engine_with_zero_fees(collector)
+        collector = self.collector
+        collector.update_many([
+            ("bybit", "AMIUSDT", 101.0, 102.0, 2.0, 2.0),
+            ("mexc", "AMIUSDT", 100.0, 101.0, 3.0, 3.0),
+        ])
+        bybit, mexc = collector.snapshot_cex("AMIUSDT")
+        engine = self.engine_zero
 
         with patch("core.arbitrage_engine.logger.success") as mock_success:
             engine._check_cex_cex(bybit, mexc)
@@ -1,6 +1,6 @@
 import unittest
 
-from core.price_collector import PriceCollector
+from core.price_collector import PriceCollector, PriceData
 
 
 class TestPriceCollector(unittest.TestCase):
@@ -46,6 +46,15 @@ class TestPriceCollector(unittest.TestCase):
         self.assertIsNone(apt_mexc)
         self.assertEqual(apt_bybit.bid, 10.0)
 
+    def test_snapshot_cex_returns_bybit_and_mexc(self):
+        collector = PriceCollector()
+        collector.update("bybit", "AMIUSDT", 1.0, 1.1)
+
+        bybit, mexc = collector.snapshot_cex("AMIUSDT")
+        self.assertEqual(bybit.bid, 1.0)
+        self.assertIsNone(mexc)
+        self.assertEqual(collector.snapshot_cex("APTUSDT"), (None, None))
+
     def test_get_all_symbols_lists_known_symbols(self):
         collector = PriceCollector()
         collector.update("bybit", "AMIUSDT", 1.0, 1.1)
@@ -55,6 +64,49 @@ class TestPriceCollector(unittest.TestCase):
         self.assertIn("AMIUSDT", symbols)
         self.assertIn("APTUSDT", symbols)
 
+    def test_update_accepts_one_sided_depth(self):
+        collector = PriceCollector()
+
+        collector.update("mexc", "AMIUSDT", 1.0, 1.1, asks=[(1.1, 2.0), (1.2, 3.0)])
+
+        mexc = collector.get_exchange("AMIUSDT", "mexc")
+        self.assertEqual(mexc.ask_qty, 5.0)
+        self.assertEqual(mexc.depth_levels, 2)
+
+    def test_update_many_stores_rows_and_skips_invalid(self):
+        collector = PriceCollector()
+
+        collector.update_many([
+            ("bybit", "AMIUSDT", 1.0, 1.1, 5.0, 6.0),
+            ("mexc", "AMIUSDT", 0.0, 1.1, 5.0, 6.0),
+            ("mexc", "APTUSDT", 10.0, 10.1, 1.0, 2.0),
+        ])
+
+        self.assertEqual(collector.get_exchange("AMIUSDT", "bybit").ask_qty, 6.0)
+        self.assertIsNone(collector.get_exchange("AMIUSDT", "mexc"))
+        self.assertEqual(collector.get_exchange("APTUSDT", "mexc").bid, 10.0)
+
+    def test_clear_drops_all_prices(self):
+        collector = PriceCollector()
+        collector.update("bybit", "AMIUSDT", 1.0, 1.1)
+
+        collector.clear()
+        self.assertEqual(collector.get_all_symbols(), [])
+
+    def test_load_snapshot_replaces_all_prices(self):
+        collector = PriceCollector()
+        collector.update("bybit", "APTUSDT", 10.0, 10.1)
+
+        snapshot = {"AMIUSDT": {"mexc": PriceData(1.0, 1.1, 5.0, 6.0)}}
+        collector.load_snapshot(snapshot)
+
+        self.assertEqual(collector.get_all_symbols(), ["AMIUSDT"])
+        self.assertEqual(collector.get_exchange("AMIUSDT", "mexc").ask_qty, 6.0)
+
+        # The collector keeps its own per-symbol dicts
+        collector.update("bybit", "AMIUSDT", 1.0, 1.1)
+        self.assertNotIn("bybit", snapshot["AMIUSDT"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,21 @@
+import atexit
 import json
+import math
 import os
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
 from typing import Any, Dict
 
 from loguru import logger
 
+try:
+    import orjson  # optional: faster NDJSON encoding
+except ImportError:
+    orjson = None
+
 os.makedirs("logs", exist_ok=True)
 
 # Remove default handler and configure once
@@ -24,10 +33,36 @@ logger.add(
     level="DEBUG",
 )
 
+class _SizeRotation:
+    """Loguru rotation check that keeps a running byte count.
+
+    Loguru's built-in ``"50 MB"`` rotation seeks to the end of the file on
+    every record; this only does so when a new file is opened.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._file = None
+        self._size = 0
+
+    def __call__(self, message, file) -> bool:
+        if file is not self._file:
+            file.seek(0, 2)
+            self._file = file
+            self._size = file.tell()
+        # Bytes, not characters: log lines carry box-drawing glyphs and emoji.
+        # utf-8 is loguru's default file-sink encoding.
+        self._size += len(message.encode("utf-8"))
+        if self._size > self._limit:
+            self._file = None
+            return True
+        return False
+
+
 # Rotating file log — all levels including DEBUG price ticks
 logger.add(
     "logs/arb_bot_{time:YYYY-MM-DD}.log",
-    rotation="50 MB",
+    rotation=_SizeRotation(50 * 1000 * 1000),
     retention="7 days",
     compression="gz",
     format="{time:YYYY-MM-DD HH:mm:ss.SSS} | {level:<8} | {name}:{function}:{line} | {message}",
@@ -40,22 +75,162 @@ _PRICE_LOG_PATH = "logs/prices.jsonl"
 _ARBITRAGE_LOG_PATH = "logs/arbitrage_opportunities.jsonl"
 
 
+def _dumps_line(payload: Dict[str, Any]) -> bytes:
+    """Encode *payload* as one NDJSON line (bytes, trailing newline included)."""
+    if orjson is not None:
+        try:
+            # Datetimes and dataclasses pass through to default=str so the
+            # records read the same as the json.dumps ones below.
+            line = orjson.dumps(
+                payload,
+                default=str,
+                option=orjson.OPT_APPEND_NEWLINE
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS,
+            )
+        except TypeError:
+            # orjson.JSONEncodeError: ints beyond 64 bits, tuple keys, ...
+            # which the stdlib encoder accepts.
+            pass
+        else:
+            # orjson writes NaN/Inf as null; keep the stdlib's NaN/Infinity.
+            if b"null" not in line or not _has_nonfinite(payload):
+                return line
+    return (json.dumps(payload, default=str) + "\n").encode()
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(v) for v in obj)
+    return False
+
+
+# Signals are raised from the arb engine's event loop, so the file I/O is
+# handed to a writer thread.  Lines are serialised by the caller (the payload
+# dict may be reused after log_signal returns); None stops the writer.
+_signal_q: "queue.SimpleQueue[bytes | None]" = queue.SimpleQueue()
+_signal_writer_thread: threading.Thread | None = None
+_signal_writer_lock = threading.Lock()
+# Set once the writer has exited (open failure, crash or shutdown); from
+# then on log_signal drops lines instead of growing the queue forever.
+_signal_writer_dead = False
+
+
+_SIGNAL_FLUSH_N = 32  # max lines joined into one write()
+
+
+def _signal_writer() -> None:
+    global _signal_writer_dead
+    try:
+        try:
+            fd = os.open(_SIGNAL_LOG_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        except OSError as e:
+            logger.warning(f"log_signal open error: {e} — signals will not be written")
+            return
+        try:
+            stop = False
+            while not stop:
+                # Block for the first line, then take whatever else is already
+                # queued so a burst of signals costs one syscall.
+                batch = [_signal_q.get()]
+                while len(batch) < _SIGNAL_FLUSH_N and not _signal_q.empty():
+                    batch.append(_signal_q.get_nowait())
+                if None in batch:
+                    stop = True
+                    batch = [line for line in batch if line is not None]
+                if batch:
+                    try:
+                        os.write(fd, b"".join(batch))
+                    except OSError as e:
+                        logger.warning(f"log_signal write error: {e}")
+        finally:
+            os.close(fd)
+    finally:
+        _signal_writer_dead = True
+
+
+def _drain_signal_queue() -> int:
+    """Empty the queue; return how many real lines (not sentinels) were in it."""
+    dropped = 0
+    while not _signal_q.empty():
+        if _signal_q.get_nowait() is not None:
+            dropped += 1
+    return dropped
+
+
+def _stop_signal_writer() -> None:
+    if _signal_writer_thread is not None:
+        _signal_q.put(None)
+        _signal_writer_thread.join(timeout=2.0)
+        dropped = _drain_signal_queue()
+        if dropped:
+            logger.warning(f"log_signal: {dropped} signal(s) not written at shutdown")
+
+
+def _ensure_signal_writer() -> None:
+    global _signal_writer_thread
+    with _signal_writer_lock:
+        if _signal_writer_thread is None:
+            _signal_writer_thread = threading.Thread(
+                target=_signal_writer, name="signal-writer", daemon=True
+            )
+            _signal_writer_thread.start()
+            atexit.register(_stop_signal_writer)
+
+
 def log_signal(payload: Dict[str, Any]) -> None:
-    now = time.time()
-    payload.setdefault("ts", now)
+    # ts_ns is the exact integer clock; ts (float seconds) stays for readers
+    # of the existing schema.  A caller-supplied ts is kept and ts_ns is
+    # derived from it, so the two always agree.
+    if "ts_ns" not in payload:
+        ts = payload.get("ts")
+        payload["ts_ns"] = round(ts * 1e9) if ts is not None else time.time_ns()
+    now = payload.setdefault("ts", payload["ts_ns"] / 1e9)
     payload.setdefault("detected_at", datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3])
+    if _signal_writer_dead:
+        return
     try:
-        with open(_SIGNAL_LOG_PATH, "a") as f:
-            f.write(json.dumps(payload, default=str) + "\n")
+        if _signal_writer_thread is None:
+            _ensure_signal_writer()
+        _signal_q.put_nowait(_dumps_line(payload))
     except Exception as e:
         logger.warning(f"log_signal write error: {e}")
 
 
+# One O_APPEND descriptor per NDJSON file, opened on first use and kept for
+# the life of the process; each line goes out in a single os.write().
+_append_fds: Dict[str, int] = {}
+_append_fds_lock = threading.Lock()
+
+
+def _append_line(path: str, line: bytes) -> None:
+    fd = _append_fds.get(path)
+    if fd is None:
+        with _append_fds_lock:
+            fd = _append_fds.get(path)
+            if fd is None:
+                fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                _append_fds[path] = fd
+    os.write(fd, line)
+
+
+@atexit.register
+def _close_append_fds() -> None:
+    with _append_fds_lock:
+        for fd in _append_fds.values():
+            os.close(fd)
+        _append_fds.clear()
+
+
 def log_price_update(payload: Dict[str, Any]) -> None:
     payload.setdefault("ts", time.time())
     try:
-        with open(_PRICE_LOG_PATH, "a") as f:
-            f.write(json.dumps(payload, default=str) + "\n")
+        _append_line(_PRICE_LOG_PATH, _dumps_line(payload))
     except Exception as e:
         logger.warning(f"log_price_update write error: {e}")
 
@@ -134,8 +309,7 @@ def log_arbitrage_opportunity(payload: Dict[str, Any]) -> None:
     payload["trade_steps"] = trade_steps
     
     try:
-        with open(_ARBITRAGE_LOG_PATH, "a") as f:
-            f.write(json.dumps(payload, default=str) + "\n")
+        _append_line(_ARBITRAGE_LOG_PATH, _dumps_line(payload))
     except Exception as e:
         logger.warning(f"log_arbitrage_opportunity write error: {e}")
 
@@ -4,6 +4,7 @@ View AMI/APT price history from logs/prices.jsonl
 """
 
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -17,13 +18,17 @@ def main():
         print("   Run the listener first to collect price data.")
         return
     
-    print()
-    print("=" * 100)
-    print(" 💰 AMI/APT PRICE HISTORY (from Cellana DEX)")
-    print("=" * 100)
-    print()
-    print(f"{'Timestamp':<20} {'Version':<12} {'Spot Price':<14} {'Price+Fee':<14} {'Reserves AMI':<20} {'Reserves APT':<20}")
-    print("-" * 100)
+    # Build the report in memory and emit it with a single write
+    out: list[str] = []
+    p = out.append
+
+    p("")
+    p("=" * 100)
+    p(" 💰 AMI/APT PRICE HISTORY (from Cellana DEX)")
+    p("=" * 100)
+    p("")
+    p(f"{'Timestamp':<20} {'Version':<12} {'Spot Price':<14} {'Price+Fee':<14} {'Reserves AMI':<20} {'Reserves APT':<20}")
+    p("-" * 100)
     
     count = 0
     with open(prices_file, 'r') as f:
@@ -45,25 +50,25 @@ def main():
                 reserves_ami = data.get('reserves_ami', 0)
                 reserves_apt = data.get('reserves_apt', 0)
                 
-                print(f"{ts_str:<20} {version:<12} {price_spot:<14.8f} {price_with_fee:<14.8f} {reserves_ami:<20,} {reserves_apt:<20,}")
+                p(f"{ts_str:<20} {version:<12} {price_spot:<14.8f} {price_with_fee:<14.8f} {reserves_ami:<20,} {reserves_apt:<20,}")
                 count += 1
                 
             except json.JSONDecodeError:
                 continue
             except Exception as e:
-                print(f"Error parsing line: {e}")
+                p(f"Error parsing line: {e}")
                 continue
     
-    print("-" * 100)
-    print(f"Total records: {count}")
-    print()
+    p("-" * 100)
+    p(f"Total records: {count}")
+    p("")
     
     # Calculate statistics if we have data
     if count > 0:
-        print("=" * 100)
-        print(" 📊 STATISTICS")
-        print("=" * 100)
-        print()
+        p("=" * 100)
+        p(" 📊 STATISTICS")
+        p("=" * 100)
+        p("")
         
         prices = []
         with open(prices_file, 'r') as f:
@@ -81,11 +86,13 @@ def main():
             min_price = min(prices)
             max_price = max(prices)
             
-            print(f"  Average Spot Price:  {avg_price:.8f} APT/AMI")
-            print(f"  Min Spot Price:      {min_price:.8f} APT/AMI")
-            print(f"  Max Spot Price:      {max_price:.8f} APT/AMI")
-            print(f"  Price Range:         {(max_price - min_price):.8f} APT ({((max_price - min_price)/avg_price * 100):.2f}%)")
-            print()
+            p(f"  Average Spot Price:  {avg_price:.8f} APT/AMI")
+            p(f"  Min Spot Price:      {min_price:.8f} APT/AMI")
+            p(f"  Max Spot Price:      {max_price:.8f} APT/AMI")
+            p(f"  Price Range:         {(max_price - min_price):.8f} APT ({((max_price - min_price)/avg_price * 100):.2f}%)")
+            p("")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":